@@ -12,6 +12,12 @@ class CrawlingError(Exception):
         self.details = details or {}
 
 
+class ContentNotModifiedError(CrawlingError):
+    """Remote content has not changed since the last crawl (HTTP 304)."""
+
+    pass
+
+
 class RetryableError(CrawlingError):
     """Errors that should be retried (temporary failures)."""
 
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.4 on 2025-08-20 10:12
+
+from django.db import migrations, models
+
+
+def backfill_last_content_hash(apps, schema_editor):
+    BankDataSource = apps.get_model("banks", "BankDataSource")
+    CrawledContent = apps.get_model("banks", "CrawledContent")
+
+    for data_source in BankDataSource.objects.all():
+        last_successful_crawl = (
+            CrawledContent.objects.filter(
+                data_source=data_source, processing_status="completed"
+            )
+            .order_by("-crawled_at")
+            .first()
+        )
+        if last_successful_crawl and last_successful_crawl.content_hash:
+            data_source.last_content_hash = last_successful_crawl.content_hash
+            data_source.save(update_fields=["last_content_hash"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("banks", "0010_add_sync_timestamps_to_crawled_content"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bankdatasource",
+            name="last_content_hash",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="Content hash of the last successfully processed crawl",
+                max_length=64,
+            ),
+        ),
+        migrations.RunPython(backfill_last_content_hash, migrations.RunPython.noop),
+    ]
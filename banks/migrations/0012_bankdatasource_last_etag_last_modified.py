@@ -0,0 +1,32 @@
+# Generated by Django 5.2.4 on 2025-08-20 11:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("banks", "0011_bankdatasource_last_content_hash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bankdatasource",
+            name="last_etag",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="ETag returned with the last successfully processed content",
+                max_length=255,
+            ),
+        ),
+        migrations.AddField(
+            model_name="bankdatasource",
+            name="last_modified",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="Last-Modified header returned with the last successfully processed content",
+                max_length=64,
+            ),
+        ),
+    ]
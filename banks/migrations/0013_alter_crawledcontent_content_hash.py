@@ -0,0 +1,21 @@
+# Generated by Django 5.2.4 on 2025-08-20 11:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("banks", "0012_bankdatasource_last_etag_last_modified"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="crawledcontent",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                help_text="xxh3-128 hash of extracted content for change detection",
+                max_length=64,
+            ),
+        ),
+    ]
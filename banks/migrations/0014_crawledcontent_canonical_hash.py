@@ -0,0 +1,22 @@
+# Generated by Django 5.2.4 on 2025-08-20 12:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("banks", "0013_alter_crawledcontent_content_hash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="crawledcontent",
+            name="canonical_hash",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="Hash of whitespace-normalized extracted content for reusing parses",
+                max_length=64,
+            ),
+        ),
+    ]
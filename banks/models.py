@@ -59,6 +59,24 @@ class BankDataSource(Audit):
     last_verified_at = models.DateTimeField(null=True, blank=True)
     last_crawled_at = models.DateTimeField(null=True, blank=True)
     last_successful_crawl_at = models.DateTimeField(null=True, blank=True)
+    last_content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        help_text="Content hash of the last successfully processed crawl",
+    )
+    last_etag = models.CharField(
+        max_length=255,
+        blank=True,
+        default="",
+        help_text="ETag returned with the last successfully processed content",
+    )
+    last_modified = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        help_text="Last-Modified header returned with the last successfully processed content",
+    )
 
     class Meta:
         ordering = ["bank__name", "url"]
@@ -133,7 +151,13 @@ class CrawledContent(Audit):
     content_hash = models.CharField(
         max_length=64,
         blank=True,
-        help_text="SHA256 hash of extracted content for change detection",
+        help_text="xxh3-128 hash of extracted content for change detection",
+    )
+    canonical_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        help_text="Hash of whitespace-normalized extracted content for reusing parses",
     )
     parsed_json = models.JSONField(default=dict, blank=True, null=True)
     parsed_json_raw = models.JSONField(
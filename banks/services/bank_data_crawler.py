@@ -1,12 +1,17 @@
-import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import xxhash
+
+from django.conf import settings
+from django.db import connection
 from django.utils import timezone
 
 from banks.exceptions import (
     AIParsingError,
     ConfigurationError,
     ContentExtractionError,
+    ContentNotModifiedError,
     FileFormatError,
     NetworkError,
 )
@@ -14,6 +19,7 @@ from banks.models import BankDataSource, CrawledContent
 from banks.services.content_extractor import ContentExtractor
 from banks.services.credit_card_data_service import CreditCardDataService
 from banks.services.llm_parser import LLMContentParser
+from banks.utils import collapse_whitespace
 
 logger = logging.getLogger(__name__)
 
@@ -61,7 +67,14 @@ class BankDataCrawlerService:
             self._update_crawl_timestamp(data_source)
 
             # Extract content with error handling
-            raw_content, extracted_content = self._extract_content_safely(data_source)
+            try:
+                raw_content, extracted_content = self._extract_content_safely(data_source)
+            except ContentNotModifiedError:
+                logger.info(
+                    f"Content not modified for {data_source.bank.name} - {data_source.url}"
+                )
+                self._record_no_changes(data_source, data_source.last_content_hash)
+                return True
             if not extracted_content:
                 return False
 
@@ -100,9 +113,22 @@ class BankDataCrawlerService:
         """
         active_sources = BankDataSource.objects.filter(is_active=True)
         results = {"total": active_sources.count(), "successful": 0, "failed": 0}
+        max_workers = getattr(settings, "CRAWLER_MAX_WORKERS", 8)
 
-        for data_source in active_sources:
-            if self.crawl_bank_data_source(data_source.id):
+        if max_workers <= 1:
+            outcomes = [self.crawl_bank_data_source(ds.id) for ds in active_sources]
+        else:
+            # Crawling is I/O bound (HTTP fetches, LLM calls, DB writes), so threads
+            # overlap the waiting while each worker keeps its own DB connection
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(self._crawl_in_worker_thread, ds.id)
+                    for ds in active_sources
+                ]
+                outcomes = [future.result() for future in as_completed(futures)]
+
+        for success in outcomes:
+            if success:
                 results["successful"] += 1
             else:
                 results["failed"] += 1
@@ -110,6 +136,28 @@ class BankDataCrawlerService:
         logger.info(f"Crawling completed: {results}")
         return results
 
+    def _crawl_in_worker_thread(self, data_source_id):
+        """Crawl a data source from a worker thread and release its DB connection.
+
+        Parameters
+        ----------
+        data_source_id : int
+            ID of the BankDataSource to crawl
+
+        Returns
+        -------
+        bool
+            True if crawling was successful, False if any step failed
+        """
+        try:
+            return self.crawl_bank_data_source(data_source_id)
+        except Exception as e:
+            # Keep one failing source from aborting the counts of the whole run
+            logger.error(f"Crawl worker failed for data source {data_source_id}: {e}")
+            return False
+        finally:
+            connection.close()
+
     def _get_data_source(self, data_source_id):
         """Get active data source by ID.
 
@@ -158,11 +206,22 @@ class BankDataCrawlerService:
         tuple of (str, str) or (None, None)
             First element is raw content, second is extracted content.
             Returns (None, None) on extraction failure.
+
+        Raises
+        ------
+        ContentNotModifiedError
+            If the server reports the content unchanged since the last crawl
         """
+        cache_validators = self._get_cache_validators(data_source)
         try:
             raw_content, extracted_content = self.content_extractor.extract_content(
-                data_source.url, data_source.content_type
+                data_source.url,
+                data_source.content_type,
+                cache_validators=cache_validators,
             )
+            # Kept in memory only; persisted once the content is fully processed
+            data_source.last_etag = cache_validators.get("etag", "")
+            data_source.last_modified = cache_validators.get("last_modified", "")
             return raw_content, extracted_content
         except (ContentExtractionError, NetworkError, FileFormatError) as e:
             logger.error(
@@ -172,8 +231,30 @@ class BankDataCrawlerService:
             self._create_failed_crawl_record(data_source, e.message)
             return None, None
 
+    def _get_cache_validators(self, data_source):
+        """Get HTTP cache validators for a conditional fetch of a data source.
+
+        Parameters
+        ----------
+        data_source : BankDataSource
+            Data source whose stored validators should be used
+
+        Returns
+        -------
+        dict
+            Validators with keys 'etag' and 'last_modified', or an empty dict
+            when the source has no successfully processed content to fall back on
+        """
+        if not data_source.last_content_hash:
+            return {}
+
+        return {
+            "etag": data_source.last_etag,
+            "last_modified": data_source.last_modified,
+        }
+
     def _generate_content_hash(self, content):
-        """Generate SHA256 hash for content change detection.
+        """Generate a fast non-cryptographic hash for content change detection.
 
         Parameters
         ----------
@@ -183,9 +264,9 @@ class BankDataCrawlerService:
         Returns
         -------
         str
-            SHA256 hash of the content as hexadecimal string
+            128-bit xxh3 hash of the content as hexadecimal string
         """
-        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return xxhash.xxh3_128(content.encode("utf-8")).hexdigest()
 
     def _should_skip_processing(self, data_source, content_hash):
         """Check if content processing should be skipped due to no changes.
@@ -193,7 +274,7 @@ class BankDataCrawlerService:
         Parameters
         ----------
         data_source : BankDataSource
-            Data source to check for existing content
+            Data source carrying the hash of its last processed content
         content_hash : str
             Hash of current content to compare against previous crawls
 
@@ -203,15 +284,10 @@ class BankDataCrawlerService:
             True if processing should be skipped (no changes detected),
             False if content has changed and should be processed
         """
-        last_successful_crawl = (
-            CrawledContent.objects.filter(
-                data_source=data_source, processing_status="completed"
-            )
-            .order_by("-crawled_at")
-            .first()
-        )
-
-        if last_successful_crawl and last_successful_crawl.content_hash == content_hash:
+        if (
+            data_source.last_content_hash
+            and data_source.last_content_hash == content_hash
+        ):
             logger.info(
                 f"No changes detected for {data_source.bank.name} - {data_source.url}"
             )
@@ -228,7 +304,7 @@ class BankDataCrawlerService:
         data_source : BankDataSource
             Data source instance to update
         content_hash : str
-            SHA256 hash of the unchanged content
+            Hash of the unchanged content
 
         Returns
         -------
@@ -237,7 +313,9 @@ class BankDataCrawlerService:
         # Update successful crawl timestamp
         current_time = timezone.now()
         data_source.last_successful_crawl_at = current_time
-        data_source.save(update_fields=["last_successful_crawl_at"])
+        data_source.save(
+            update_fields=["last_successful_crawl_at", "last_etag", "last_modified"]
+        )
 
         # Find the latest completed crawl record with matching hash
         latest_crawl = (
@@ -282,7 +360,7 @@ class BankDataCrawlerService:
         extracted_content : str
             Extracted and cleaned text content
         content_hash : str
-            SHA256 hash of the content for change tracking
+            Hash of the content for change tracking
 
         Returns
         -------
@@ -293,8 +371,11 @@ class BankDataCrawlerService:
             f"Content changes detected for {data_source.bank.name}, processing..."
         )
 
-        # Parse content with AI
-        parsing_result = self._parse_content_safely(data_source, extracted_content)
+        # Reuse the previous parse when only whitespace changed, otherwise parse with AI
+        canonical_hash = self._generate_canonical_hash(extracted_content)
+        parsing_result = self._find_reusable_parse(data_source, canonical_hash)
+        if parsing_result is None:
+            parsing_result = self._parse_content_safely(data_source, extracted_content)
         if not parsing_result:
             return False
 
@@ -309,11 +390,59 @@ class BankDataCrawlerService:
             content_hash,
             structured_data,
             raw_comprehensive_data,
+            canonical_hash,
         )
 
         # Update database
         return self._update_database_safely(data_source, structured_data, crawled_content)
 
+    def _generate_canonical_hash(self, content):
+        """Generate a hash of content with all whitespace runs collapsed.
+
+        Parameters
+        ----------
+        content : str
+            Extracted text content
+
+        Returns
+        -------
+        str
+            Hash that is identical for contents differing only in whitespace
+        """
+        return self._generate_content_hash(collapse_whitespace(content))
+
+    def _find_reusable_parse(self, data_source, canonical_hash):
+        """Find parsed data of a previous crawl with equivalent content.
+
+        Parameters
+        ----------
+        data_source : BankDataSource
+            Data source being processed
+        canonical_hash : str
+            Whitespace-normalized hash of the current content
+
+        Returns
+        -------
+        tuple of (dict, dict) or None
+            Tuple of (structured_data, raw_comprehensive_data) copied from the
+            latest completed crawl when its canonical hash matches, None otherwise
+        """
+        previous_crawl = (
+            CrawledContent.objects.filter(
+                data_source=data_source, processing_status="completed"
+            )
+            .only("canonical_hash", "parsed_json", "parsed_json_raw")
+            .order_by("-crawled_at")
+            .first()
+        )
+        if previous_crawl is None or previous_crawl.canonical_hash != canonical_hash:
+            return None
+
+        logger.info(
+            f"Only whitespace changed for {data_source.bank.name}, reusing previous parse"
+        )
+        return previous_crawl.parsed_json, previous_crawl.parsed_json_raw
+
     def _parse_content_safely(self, data_source, content):
         """Safely parse content with AI, handling errors.
 
@@ -351,6 +480,7 @@ class BankDataCrawlerService:
         content_hash,
         parsed_data,
         raw_comprehensive_data,
+        canonical_hash="",
     ):
         """Create a crawled content record with both structured and raw comprehensive data.
 
@@ -363,11 +493,13 @@ class BankDataCrawlerService:
         extracted_content : str
             Extracted text content
         content_hash : str
-            SHA256 hash for change detection
+            Hash for change detection
         parsed_data : dict
             Structured parsed data from LLM
         raw_comprehensive_data : dict
             Raw comprehensive data with all extracted fields
+        canonical_hash : str, optional
+            Whitespace-normalized content hash used to reuse this parse
 
         Returns
         -------
@@ -379,6 +511,7 @@ class BankDataCrawlerService:
             raw_content=raw_content,
             extracted_content=extracted_content,
             content_hash=content_hash,
+            canonical_hash=canonical_hash,
             parsed_json=parsed_data,
             parsed_json_raw=raw_comprehensive_data,
             processing_status="processing",
@@ -450,7 +583,7 @@ class BankDataCrawlerService:
         crawled_content : CrawledContent
             Content record to mark as completed
         data_source : BankDataSource
-            Data source to reset failure counters
+            Data source to reset failure counters and store the processed hash
         updated_count : int
             Number of credit cards updated in the database
 
@@ -464,7 +597,15 @@ class BankDataCrawlerService:
         # Reset failed attempts on success
         data_source.reset_failed_attempts()
         data_source.last_successful_crawl_at = timezone.now()
-        data_source.save(update_fields=["last_successful_crawl_at"])
+        data_source.last_content_hash = crawled_content.content_hash
+        data_source.save(
+            update_fields=[
+                "last_successful_crawl_at",
+                "last_content_hash",
+                "last_etag",
+                "last_modified",
+            ]
+        )
 
         logger.info(
             f"Successfully updated {updated_count} credit cards for {data_source.bank.name}"
@@ -1,18 +1,185 @@
 import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from io import BytesIO
 
 import magic
 import pandas as pd
 import requests
+import xxhash
 from bs4 import BeautifulSoup
 from PIL import Image
 from pypdf import PdfReader
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+try:
+    import pytesseract
+except ImportError:
+    pytesseract = None
+
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 
 from banks.enums import ContentType
-from banks.exceptions import ContentExtractionError, FileFormatError, NetworkError
+from banks.exceptions import (
+    ContentExtractionError,
+    ContentNotModifiedError,
+    FileFormatError,
+    NetworkError,
+)
+from banks.utils import collapse_layout_whitespace
 
 logger = logging.getLogger(__name__)
 
+# Content types whose raw bytes are stored as decoded text alongside the extraction
+TEXT_CONTENT_TYPES = (ContentType.WEBPAGE, ContentType.CSV)
+
+# libmagic only inspects leading signature bytes, so detection never needs more
+MAGIC_HEADER_BYTES = 8192
+SNIFF_HEADER_BYTES = 64
+PDF_SIGNATURE = b"%PDF-"
+IMAGE_SIGNATURES = (b"\x89PNG", b"\xff\xd8\xff", b"GIF8")
+HTML_SIGNATURES = (b"<!doc", b"<html")
+
+# Responses are streamed in socket-buffer sized chunks and aborted past the size cap
+FETCH_CHUNK_BYTES = 64 * 1024
+MAX_CONTENT_BYTES = 50 * 1024 * 1024
+WEBPAGE_TEXT_CACHE_SIZE = 128
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+OCR_MAX_WORKERS = min(8, os.cpu_count() or 1)
+OCR_PIPELINE_DEPTH = 4
+PIXMAP_MODES = {1: "L", 3: "RGB", 4: "RGBA"}
+OCR_FAST_SCALE = 1.5
+OCR_FALLBACK_SCALE = 2
+OCR_MIN_PAGE_CHARS = 50
+OCR_PSM_AUTO = 3
+OCR_PSM_SINGLE_BLOCK = 6
+PDF_MIN_PAGE_TEXT_CHARS = 20
+
+_ocr_executor = None
+_ocr_executor_lock = threading.Lock()
+_mime_detectors = threading.local()
+_tesserocr_apis = threading.local()
+_http_session = None
+_webpage_text_cache = OrderedDict()
+_webpage_text_cache_lock = threading.Lock()
+_http_session_lock = threading.Lock()
+
+
+def get_ocr_executor():
+    """Return the shared thread pool used for page-level OCR.
+
+    Tesseract releases the GIL while recognising text, so pages can be
+    processed concurrently. The pool is created lazily and reused across
+    calls to avoid paying thread start-up cost per document.
+
+    Returns
+    -------
+    ThreadPoolExecutor
+        Process-wide executor sized to OCR_MAX_WORKERS
+    """
+    global _ocr_executor
+    if _ocr_executor is None:
+        with _ocr_executor_lock:
+            if _ocr_executor is None:
+                _ocr_executor = ThreadPoolExecutor(
+                    max_workers=OCR_MAX_WORKERS, thread_name_prefix="ocr"
+                )
+    return _ocr_executor
+
+
+def get_http_session():
+    """Return the process-wide HTTP session used for content fetching.
+
+    The session keeps connections alive across extractor instances and
+    retries transient gateway errors with exponential backoff.
+
+    Returns
+    -------
+    requests.Session
+        Shared session with pooled adapters mounted for HTTP and HTTPS
+    """
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                session = requests.Session()
+                session.headers.update({"User-Agent": USER_AGENT})
+                adapter = HTTPAdapter(
+                    pool_connections=20,
+                    pool_maxsize=50,
+                    max_retries=Retry(
+                        total=3,
+                        backoff_factor=0.3,
+                        status_forcelist=[502, 503, 504],
+                        raise_on_status=False,
+                    ),
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _http_session = session
+    return _http_session
+
+
+def get_tesserocr_api(psm):
+    """Return this thread's tesserocr engine for a page segmentation mode.
+
+    Engines are costly to initialise and not thread-safe, so each thread
+    keeps one per mode.
+
+    Parameters
+    ----------
+    psm : int
+        Tesseract page segmentation mode
+
+    Returns
+    -------
+    tesserocr.PyTessBaseAPI
+        Initialised engine bound to the current thread
+    """
+    apis = getattr(_tesserocr_apis, "by_psm", None)
+    if apis is None:
+        apis = _tesserocr_apis.by_psm = {}
+    if psm not in apis:
+        apis[psm] = tesserocr.PyTessBaseAPI(psm=psm)
+    return apis[psm]
+
+
+def get_mime_detector():
+    """Return this thread's cached libmagic MIME detector.
+
+    Loading the magic database is expensive, so each thread keeps one
+    ``magic.Magic`` instance; libmagic handles are not thread-safe.
+
+    Returns
+    -------
+    magic.Magic
+        MIME-mode detector bound to the current thread
+    """
+    detector = getattr(_mime_detectors, "detector", None)
+    if detector is None:
+        detector = magic.Magic(mime=True)
+        _mime_detectors.detector = detector
+    return detector
+
 
 class ContentExtractor:
     """Service for extracting content from various file types.
@@ -24,10 +191,19 @@ class ContentExtractor:
     - CSV files (structured data parsing)
     """
 
+    # Extraction method used for each content type, keyed for O(1) dispatch
+    CONTENT_HANDLERS = {
+        ContentType.PDF: "_extract_pdf_content",
+        ContentType.WEBPAGE: "_extract_webpage_content",
+        ContentType.IMAGE: "_extract_image_content",
+        ContentType.CSV: "_extract_csv_content",
+    }
+
     def __init__(self):
         """Initialize the content extractor.
 
-        Sets up HTTP session with appropriate headers for web content extraction.
+        Uses the shared HTTP session so connections to bank sites are kept
+        alive across extractor instances.
 
         Returns
         -------
@@ -37,12 +213,9 @@ class ContentExtractor:
         ------
         None
         """
-        self.session = requests.Session()
-        self.session.headers.update(
-            {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-        )
+        self.session = get_http_session()
 
-    def extract_content(self, url, content_type):
+    def extract_content(self, url, content_type, cache_validators=None):
         """Extract content from URL based on content type.
 
         Parameters
@@ -51,6 +224,10 @@ class ContentExtractor:
             The URL to extract content from
         content_type : str
             The type of content to extract (PDF, WEBPAGE, IMAGE, CSV)
+        cache_validators : dict, optional
+            HTTP cache validators from the previous fetch with keys 'etag' and
+            'last_modified'. When given, the request is made conditional and the
+            dict is updated in place with the validators of the new response.
 
         Returns
         -------
@@ -66,27 +243,33 @@ class ContentExtractor:
             For HTTP errors or general extraction failures
         FileFormatError
             For unsupported or undetectable file formats
+        ContentNotModifiedError
+            If cache validators were given and the server reports no changes
         """
-        raw_content = self._fetch_content(url)
+        raw_content = self._fetch_content(url, cache_validators)
         extracted_content = self._process_content(raw_content, content_type, url)
 
-        # For binary content types, store a placeholder for raw content to avoid NUL character issues
-        if content_type == ContentType.PDF or content_type == ContentType.IMAGE:
+        # Only text formats are worth decoding; anything else gets a placeholder so
+        # binary payloads are neither decoded nor persisted (and avoid NUL issues)
+        if content_type in TEXT_CONTENT_TYPES:
+            raw_content_str = raw_content.decode("utf-8", errors="ignore")
+        else:
             raw_content_str = (
                 f"<BINARY_CONTENT_{content_type.upper()}_SIZE_{len(raw_content)}>"
             )
-        else:
-            raw_content_str = raw_content.decode("utf-8", errors="ignore")
 
         return raw_content_str, extracted_content
 
-    def _fetch_content(self, url):
+    def _fetch_content(self, url, cache_validators=None):
         """Fetch raw content from URL.
 
         Parameters
         ----------
         url : str
             The URL to fetch content from
+        cache_validators : dict, optional
+            Validators ('etag', 'last_modified') used to make a conditional
+            request; updated in place from the response headers
 
         Returns
         -------
@@ -98,12 +281,35 @@ class ContentExtractor:
         NetworkError
             For network timeouts or connection errors
         ContentExtractionError
-            For HTTP errors (404, 500, etc.) or unexpected failures
+            For HTTP errors (404, 500, etc.), oversized responses or
+            unexpected failures
+        ContentNotModifiedError
+            If the server answers a conditional request with 304 Not Modified
         """
         try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            return response.content
+            with closing(
+                self.session.get(
+                    url,
+                    timeout=30,
+                    stream=True,
+                    headers=self._build_conditional_headers(cache_validators),
+                )
+            ) as response:
+                if response.status_code == 304:
+                    raise ContentNotModifiedError(
+                        f"Content not modified for {url}",
+                        {"url": url, "status_code": 304},
+                    )
+                response.raise_for_status()
+
+                if cache_validators is not None:
+                    cache_validators["etag"] = response.headers.get("ETag", "")
+                    cache_validators["last_modified"] = response.headers.get(
+                        "Last-Modified", ""
+                    )
+                return self._read_response_body(response, url)
+        except (ContentNotModifiedError, ContentExtractionError):
+            raise
         except requests.exceptions.Timeout as e:
             raise NetworkError(
                 f"Timeout while fetching {url}", {"url": url, "timeout": 30}
@@ -113,25 +319,106 @@ class ContentExtractor:
                 f"Connection error while fetching {url}", {"url": url}
             ) from e
         except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 404:
-                raise ContentExtractionError(
-                    f"URL not found: {url}", {"url": url, "status_code": 404}
-                ) from e
-            elif e.response.status_code >= 500:
-                raise NetworkError(
-                    f"Server error for {url}: {e.response.status_code}",
-                    {"url": url, "status_code": e.response.status_code},
-                ) from e
-            else:
-                raise ContentExtractionError(
-                    f"HTTP error for {url}: {e.response.status_code}",
-                    {"url": url, "status_code": e.response.status_code},
-                ) from e
+            raise self._build_http_error(e.response.status_code, url) from e
         except Exception as e:
             raise ContentExtractionError(
                 f"Unexpected error extracting content from {url}", {"url": url}
             ) from e
 
+    def _build_http_error(self, status_code, url):
+        """Map an HTTP error status to the matching crawling exception.
+
+        Parameters
+        ----------
+        status_code : int
+            HTTP status code of the failed response
+        url : str
+            Requested URL for error reporting
+
+        Returns
+        -------
+        CrawlingError
+            NetworkError for server errors, ContentExtractionError otherwise
+        """
+        if status_code == 404:
+            return ContentExtractionError(
+                f"URL not found: {url}", {"url": url, "status_code": 404}
+            )
+        elif status_code >= 500:
+            return NetworkError(
+                f"Server error for {url}: {status_code}",
+                {"url": url, "status_code": status_code},
+            )
+        return ContentExtractionError(
+            f"HTTP error for {url}: {status_code}",
+            {"url": url, "status_code": status_code},
+        )
+
+    def _read_response_body(self, response, url):
+        """Read a streamed response body, aborting once it exceeds the size cap.
+
+        Parameters
+        ----------
+        response : requests.Response
+            Response opened with ``stream=True``
+        url : str
+            Requested URL for error reporting
+
+        Returns
+        -------
+        bytes
+            Complete response body
+
+        Raises
+        ------
+        ContentExtractionError
+            If the body is larger than MAX_CONTENT_BYTES
+        """
+        # Reject declared oversize bodies before downloading anything; the
+        # running count below still guards against missing or wrong headers
+        try:
+            declared_length = int(response.headers.get("Content-Length"))
+        except (TypeError, ValueError):
+            declared_length = None
+        if declared_length is not None and declared_length > MAX_CONTENT_BYTES:
+            raise ContentExtractionError(
+                f"Content too large for {url}",
+                {"url": url, "max_bytes": MAX_CONTENT_BYTES},
+            )
+
+        buffer = BytesIO()
+        for chunk in response.iter_content(chunk_size=FETCH_CHUNK_BYTES):
+            buffer.write(chunk)
+            if buffer.tell() > MAX_CONTENT_BYTES:
+                raise ContentExtractionError(
+                    f"Content too large for {url}",
+                    {"url": url, "max_bytes": MAX_CONTENT_BYTES},
+                )
+        return buffer.getvalue()
+
+    def _build_conditional_headers(self, cache_validators):
+        """Build conditional request headers from stored cache validators.
+
+        Parameters
+        ----------
+        cache_validators : dict or None
+            Validators with optional 'etag' and 'last_modified' values
+
+        Returns
+        -------
+        dict
+            If-None-Match / If-Modified-Since headers for the validators present
+        """
+        headers = {}
+        if not cache_validators:
+            return headers
+
+        if cache_validators.get("etag"):
+            headers["If-None-Match"] = cache_validators["etag"]
+        if cache_validators.get("last_modified"):
+            headers["If-Modified-Since"] = cache_validators["last_modified"]
+        return headers
+
     def _process_content(self, raw_content, content_type, url):
         """Process raw content based on content type.
 
@@ -157,26 +444,18 @@ class ContentExtractor:
             For processing errors during content extraction
         """
         try:
-            if content_type == ContentType.PDF:
-                return self._extract_pdf_content(raw_content)
-            elif content_type == ContentType.WEBPAGE:
-                return self._extract_webpage_content(
-                    raw_content.decode("utf-8", errors="ignore")
-                )
-            elif content_type == ContentType.IMAGE:
-                return self._extract_image_content(raw_content)
-            elif content_type == ContentType.CSV:
-                return self._extract_csv_content(raw_content)
-            else:
+            handler_name = self.CONTENT_HANDLERS.get(content_type)
+            if handler_name is None:
                 # Auto-detect content type if not specified correctly
                 detected_type = self._detect_content_type(raw_content)
-                if detected_type:
-                    return self._process_content(raw_content, detected_type, url)
-                else:
+                handler_name = self.CONTENT_HANDLERS.get(detected_type)
+                if handler_name is None:
                     raise FileFormatError(
                         f"Unable to detect content type for {url}",
                         {"url": url, "content_type": content_type},
                     )
+
+            return getattr(self, handler_name)(raw_content)
         except (ContentExtractionError, NetworkError, FileFormatError):
             raise
         except Exception as e:
@@ -188,6 +467,10 @@ class ContentExtractor:
     def _extract_pdf_content(self, raw_content):
         """Extract text content from PDF, with OCR fallback for image-based PDFs.
 
+        The document is parsed once with PyMuPDF and the same open document
+        is reused to OCR pages without a text layer; pypdf is the fallback
+        when PyMuPDF is missing or cannot open the file.
+
         Parameters
         ----------
         raw_content : bytes
@@ -198,34 +481,84 @@ class ContentExtractor:
         str
             Extracted text from PDF, using OCR fallback for image-based PDFs
         """
-        if PdfReader is None:
-            logger.warning("pypdf not installed, cannot extract PDF content")
-            return ""
+        if fitz is None:
+            return self._extract_pdf_content_with_pypdf(raw_content)
 
         try:
-            pdf_file = BytesIO(raw_content)
-            reader = PdfReader(pdf_file)
-            text_content = ""
+            doc = fitz.open(stream=raw_content, filetype="pdf")
+        except Exception as e:
+            logger.error(f"PyMuPDF could not open PDF, trying pypdf: {str(e)}")
+            return self._extract_pdf_content_with_pypdf(raw_content)
 
-            for page in reader.pages:
-                text_content += page.extract_text() + "\n"
+        try:
+            page_texts = [page.get_text().strip() for page in doc]
+            self._ocr_textless_pages(
+                page_texts, lambda pages: self._ocr_document_pages(doc, pages)
+            )
+            return "\n".join(page_texts).strip()
+        except Exception as e:
+            logger.error(f"PyMuPDF text extraction failed, trying pypdf: {str(e)}")
+            return self._extract_pdf_content_with_pypdf(raw_content)
+        finally:
+            doc.close()
 
-            text_content = text_content.strip()
+    def _extract_pdf_content_with_pypdf(self, raw_content):
+        """Extract PDF text with pypdf, OCR'ing pages that lack a text layer.
 
-            # If extracted text is minimal (likely image-based PDF), try OCR
-            if len(text_content) < 50:  # Threshold for minimal text
-                logger.info("Minimal text extracted from PDF, attempting OCR...")
-                ocr_text = self._extract_pdf_with_ocr(raw_content)
-                if ocr_text and len(ocr_text) > len(text_content):
-                    return ocr_text
+        Parameters
+        ----------
+        raw_content : bytes
+            Raw PDF binary content
 
-            return text_content
+        Returns
+        -------
+        str
+            Extracted text from PDF, using OCR fallback for image-based PDFs
+        """
+        if PdfReader is None:
+            logger.warning("pypdf not installed, cannot extract PDF content")
+            return ""
+
+        try:
+            reader = PdfReader(BytesIO(raw_content))
+            page_texts = [page.extract_text() or "" for page in reader.pages]
+            self._ocr_textless_pages(
+                page_texts, lambda pages: self._ocr_pdf_page_texts(raw_content, pages)
+            )
+            return "\n".join(page_texts).strip()
         except Exception as e:
             logger.error(f"Error extracting PDF content: {str(e)}")
             # Try OCR as fallback for corrupted or complex PDFs
             logger.info("Attempting OCR fallback for PDF...")
             return self._extract_pdf_with_ocr(raw_content)
 
+    def _ocr_textless_pages(self, page_texts, ocr_pages):
+        """Replace pages without a usable text layer with their OCR text.
+
+        Parameters
+        ----------
+        page_texts : list of str
+            Text layer of every page; updated in place
+        ocr_pages : callable
+            Takes a list of zero-based page numbers and returns their OCR text
+        """
+        # OCR only the pages without a usable text layer (likely scanned)
+        ocr_candidates = [
+            page_num
+            for page_num, text in enumerate(page_texts)
+            if len(text.strip()) < PDF_MIN_PAGE_TEXT_CHARS
+        ]
+        if not ocr_candidates:
+            return
+
+        logger.info(
+            f"Minimal text on {len(ocr_candidates)} of {len(page_texts)} "
+            "PDF pages, attempting OCR..."
+        )
+        for page_num, text in zip(ocr_candidates, ocr_pages(ocr_candidates)):
+            if len(text.strip()) > len(page_texts[page_num].strip()):
+                page_texts[page_num] = text
+
     def _extract_pdf_with_ocr(self, raw_content):
         """Extract text from image-based PDF using OCR.
 
@@ -239,77 +572,270 @@ class ContentExtractor:
         str
             Text extracted via OCR from PDF pages converted to images
         """
+        return "\n".join(self._ocr_pdf_page_texts(raw_content)).strip()
+
+    def _ocr_pdf_page_texts(self, raw_content, page_indices=None):
+        """Open a PDF and OCR selected pages.
+
+        Parameters
+        ----------
+        raw_content : bytes
+            Raw PDF binary content requiring OCR processing
+        page_indices : list of int, optional
+            Zero-based pages to OCR; all pages when omitted
+
+        Returns
+        -------
+        list of str
+            OCR text per requested page in the order given, or an empty list
+            if OCR is unavailable or fails
+        """
+        if fitz is None:
+            logger.warning("PyMuPDF not available, cannot perform PDF OCR")
+            return []
+
         try:
-            # Check if required libraries are available
-            try:
-                import fitz  # PyMuPDF
-            except ImportError:
-                logger.warning("PyMuPDF not available, cannot perform PDF OCR")
-                return ""
-
-            try:
-                import pytesseract
-                from PIL import Image
-            except ImportError:
-                logger.warning("pytesseract/PIL not available, cannot perform PDF OCR")
-                return ""
-
-            # Convert PDF pages to images and extract text with OCR
             doc = fitz.open(stream=raw_content, filetype="pdf")
-            all_text = ""
+        except Exception as e:
+            logger.error(f"Error performing PDF OCR: {str(e)}")
+            return []
 
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                # Convert page to image (higher DPI for better OCR)
-                pix = page.get_pixmap(
-                    matrix=fitz.Matrix(2, 2)
-                )  # 2x scaling for better quality
-                img_data = pix.tobytes("png")
+        try:
+            if page_indices is None:
+                page_indices = list(range(len(doc)))
+            return self._ocr_document_pages(doc, page_indices)
+        finally:
+            doc.close()
 
-                # Perform OCR on the image
-                image = Image.open(BytesIO(img_data))
-                text = pytesseract.image_to_string(image, config="--psm 6")
-                all_text += text + "\n"
+    def _ocr_document_pages(self, doc, page_indices):
+        """OCR selected pages of an already open PDF document.
 
-            doc.close()
-            return all_text.strip()
+        Parameters
+        ----------
+        doc : fitz.Document
+            Open PDF document
+        page_indices : list of int
+            Zero-based pages to OCR
 
+        Returns
+        -------
+        list of str
+            OCR text per requested page in the order given, or an empty list
+            if OCR is unavailable or fails
+        """
+        if pytesseract is None and tesserocr is None:
+            logger.warning("No OCR engine available, cannot perform PDF OCR")
+            return []
+
+        try:
+            # Fast grayscale pass first, then retry sparse pages at 2x
+            page_texts = self._ocr_pages(doc, page_indices, OCR_FAST_SCALE)
+            retry_positions = [
+                position
+                for position, text in enumerate(page_texts)
+                if self._needs_ocr_retry(doc, page_indices[position], text)
+            ]
+            if retry_positions:
+                retried = self._ocr_pages(
+                    doc,
+                    [page_indices[position] for position in retry_positions],
+                    OCR_FALLBACK_SCALE,
+                )
+                for position, text in zip(retry_positions, retried):
+                    if len(text.strip()) > len(page_texts[position].strip()):
+                        page_texts[position] = text
+            return page_texts
         except Exception as e:
             logger.error(f"Error performing PDF OCR: {str(e)}")
-            return ""
+            return []
+
+    def _needs_ocr_retry(self, doc, page_num, text):
+        """Check whether a page's fast OCR pass is worth repeating at 2x.
+
+        Blank pages without images would come back empty again, so only
+        pages with some but too little text, or with embedded images, are
+        retried.
+
+        Parameters
+        ----------
+        doc : fitz.Document
+            Open PDF document
+        page_num : int
+            Zero-based page number
+        text : str
+            Text recognised by the fast pass
+
+        Returns
+        -------
+        bool
+            True if the page should be OCR'd again at the fallback scale
+        """
+        text_length = len(text.strip())
+        if text_length >= OCR_MIN_PAGE_CHARS:
+            return False
+        return text_length > 0 or bool(doc.load_page(page_num).get_images())
+
+    def _ocr_pages(self, doc, page_numbers, scale):
+        """Render the given pages and OCR them on the shared pool.
+
+        Pages are rendered on the calling thread, since PyMuPDF documents
+        are not thread-safe, while already-rendered pages are OCR'd
+        concurrently.
+
+        Parameters
+        ----------
+        doc : fitz.Document
+            Open PDF document
+        page_numbers : iterable of int
+            Zero-based page numbers to process
+        scale : float
+            Zoom factor applied when rendering each page
+
+        Returns
+        -------
+        list of str
+            OCR text for each requested page, in the order given
+        """
+        executor = get_ocr_executor()
+        in_flight = threading.BoundedSemaphore(OCR_PIPELINE_DEPTH)
+        matrix = fitz.Matrix(scale, scale)
+        futures = []
+
+        for page_num in page_numbers:
+            page = doc.load_page(page_num)
+            # Tesseract binarises internally, so grayscale loses nothing
+            pix = page.get_pixmap(matrix=matrix, colorspace=fitz.csGRAY)
+            image = self._pixmap_to_image(pix)
+
+            # Bound the number of rendered pages held in memory
+            in_flight.acquire()
+            future = executor.submit(self._ocr_page_image, image)
+            future.add_done_callback(lambda _: in_flight.release())
+            futures.append(future)
+
+        return [future.result() for future in futures]
+
+    def _pixmap_to_image(self, pix):
+        """Wrap a rendered pixmap's raw samples in a PIL image.
+
+        Building the image straight from the sample buffer avoids encoding
+        every page to PNG only to decode it again for OCR.
+
+        Parameters
+        ----------
+        pix : fitz.Pixmap
+            Rendered page pixmap
+
+        Returns
+        -------
+        PIL.Image.Image
+            Image sharing the pixmap's dimensions and channel layout
+        """
+        mode = PIXMAP_MODES[pix.n]
+        return Image.frombytes(mode, (pix.width, pix.height), pix.samples)
+
+    def _ocr_page_image(self, image):
+        """Run OCR on a single rendered PDF page.
+
+        Parameters
+        ----------
+        image : PIL.Image.Image
+            Rendered page image
+
+        Returns
+        -------
+        str
+            Text recognised on the page
+        """
+        return self._ocr_image(image, psm=OCR_PSM_SINGLE_BLOCK)
+
+    def _ocr_image(self, image, psm=None):
+        """Recognise text in an image with the fastest available OCR backend.
+
+        tesserocr calls libtesseract in-process; pytesseract, which spawns
+        the tesseract binary per call, is used when it is not installed.
+
+        Parameters
+        ----------
+        image : PIL.Image.Image
+            Image to recognise
+        psm : int, optional
+            Tesseract page segmentation mode; the engine default when omitted
+
+        Returns
+        -------
+        str
+            Recognised text
+        """
+        if tesserocr is not None:
+            api = get_tesserocr_api(OCR_PSM_AUTO if psm is None else psm)
+            api.SetImage(image)
+            return api.GetUTF8Text()
+
+        if psm is None:
+            return pytesseract.image_to_string(image)
+        return pytesseract.image_to_string(image, config=f"--psm {psm}")
 
     def _extract_webpage_content(self, html_content):
         """Extract text content from HTML webpage.
 
         Parameters
         ----------
-        html_content : str
-            Raw HTML content to process and clean
+        html_content : bytes or str
+            Raw HTML content to process and clean; bytes are handed to the
+            parser undecoded so it can sniff the document encoding itself
 
         Returns
         -------
         str
-            Cleaned text content with scripts/styles removed
+            Cleaned text content with scripts/styles removed; repeated pages
+            are served from a small LRU cache keyed by content hash
         """
+        html_bytes = (
+            html_content if isinstance(html_content, bytes) else html_content.encode()
+        )
+        cache_key = xxhash.xxh3_128_digest(html_bytes)
+        with _webpage_text_cache_lock:
+            cached_text = _webpage_text_cache.get(cache_key)
+            if cached_text is not None:
+                _webpage_text_cache.move_to_end(cache_key)
+                return cached_text
+
         try:
-            soup = BeautifulSoup(html_content, "html.parser")
+            text = self._html_to_text(html_content)
+        except Exception as e:
+            logger.error(f"Error extracting webpage content: {str(e)}")
+            return html_bytes.decode("utf-8", errors="ignore")
 
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
+        with _webpage_text_cache_lock:
+            _webpage_text_cache[cache_key] = text
+            if len(_webpage_text_cache) > WEBPAGE_TEXT_CACHE_SIZE:
+                _webpage_text_cache.popitem(last=False)
+        return text
 
-            # Get text content
-            text = soup.get_text()
+    def _html_to_text(self, html_content):
+        """Parse HTML and return its visible text with whitespace collapsed.
 
-            # Clean up whitespace
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            text = "\n".join(chunk for chunk in chunks if chunk)
+        Parameters
+        ----------
+        html_content : bytes or str
+            Raw HTML content
 
-            return text
-        except Exception as e:
-            logger.error(f"Error extracting webpage content: {str(e)}")
-            return html_content
+        Returns
+        -------
+        str
+            Cleaned text content with scripts/styles removed
+        """
+        soup = BeautifulSoup(html_content, HTML_PARSER)
+
+        # Remove script and style elements
+        for script in soup(["script", "style"]):
+            script.decompose()
+
+        # Get text content
+        text = soup.get_text()
+
+        return collapse_layout_whitespace(text)
 
     def _extract_image_content(self, raw_content):
         """Extract text content from image using OCR.
@@ -322,21 +848,16 @@ class ContentExtractor:
         Returns
         -------
         str
-            Text extracted from image using pytesseract OCR
+            Text extracted from image using Tesseract OCR
         """
-        if Image is None:
-            logger.warning("PIL not installed, cannot extract text from images")
+        if pytesseract is None and tesserocr is None:
+            logger.warning("No OCR engine installed, cannot extract text from images")
             return ""
 
         try:
-            import pytesseract
-
             image = Image.open(BytesIO(raw_content))
-            text = pytesseract.image_to_string(image)
+            text = self._ocr_image(image)
             return text.strip()
-        except ImportError:
-            logger.warning("pytesseract not installed, cannot extract text from images")
-            return ""
         except Exception as e:
             logger.error(f"Error extracting image content: {str(e)}")
             return ""
@@ -352,7 +873,7 @@ class ContentExtractor:
         Returns
         -------
         str
-            Processed CSV content as formatted string using pandas
+            Normalised CSV text re-serialised by pandas
         """
         if pd is None:
             logger.warning("pandas not installed, returning raw CSV content")
@@ -360,12 +881,36 @@ class ContentExtractor:
 
         try:
             csv_file = BytesIO(raw_content)
-            df = pd.read_csv(csv_file)
-            return df.to_string()
+            # Read every cell as text: no dtype inference, NaN or number formatting
+            df = pd.read_csv(csv_file, dtype=str, keep_default_na=False, engine="c")
+            return df.to_csv(index=False)
         except Exception as e:
             logger.error(f"Error extracting CSV content: {str(e)}")
             return raw_content.decode("utf-8", errors="ignore")
 
+    def _sniff_content_type(self, raw_content):
+        """Classify content from well-known leading signatures.
+
+        Parameters
+        ----------
+        raw_content : bytes
+            Raw binary content to analyze
+
+        Returns
+        -------
+        str or None
+            Content type for PDF, common image or HTML signatures, or None so
+            the caller can fall back to libmagic
+        """
+        head = raw_content[:SNIFF_HEADER_BYTES]
+        if head.startswith(PDF_SIGNATURE):
+            return ContentType.PDF
+        if head.startswith(IMAGE_SIGNATURES):
+            return ContentType.IMAGE
+        if head.lstrip()[:5].lower() in HTML_SIGNATURES:
+            return ContentType.WEBPAGE
+        return None
+
     def _detect_content_type(self, raw_content):
         """Detect content type from raw content.
 
@@ -379,8 +924,12 @@ class ContentExtractor:
         str or None
             Detected content type (PDF, WEBPAGE, IMAGE, CSV) or None if undetectable
         """
+        sniffed_type = self._sniff_content_type(raw_content)
+        if sniffed_type:
+            return sniffed_type
+
         try:
-            mime_type = magic.from_buffer(raw_content, mime=True)
+            mime_type = get_mime_detector().from_buffer(raw_content[:MAGIC_HEADER_BYTES])
 
             if mime_type == "application/pdf":
                 return ContentType.PDF
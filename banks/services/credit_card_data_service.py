@@ -1,9 +1,63 @@
 import logging
+import re
+from functools import lru_cache
+
+from django.db import connection, transaction
+from django.utils import timezone
 
 from credit_cards.models import CreditCard
 
 logger = logging.getLogger(__name__)
 
+# Names that are really a fee amount: currency-prefixed or only digits/separators
+FEE_LIKE_NAME_RE = re.compile(r"^(?:TK\.|US\$|[\d.,]*\d[\d.,]*$)")
+
+# Rows per INSERT ... ON CONFLICT statement when upserting cards
+UPSERT_BATCH_SIZE = 500
+
+# Columns overwritten when an existing card is upserted; must match the keys of
+# CreditCardDataService._prepare_card_defaults plus the modified timestamp
+CARD_UPDATE_FIELDS = (
+    "annual_fee",
+    "interest_rate_apr",
+    "lounge_access_international",
+    "lounge_access_domestic",
+    "cash_advance_fee",
+    "late_payment_fee",
+    "annual_fee_waiver_policy",
+    "reward_points_policy",
+    "additional_features",
+    "is_active",
+    "modified",
+)
+
+# First key of the PostgreSQL advisory lock serializing card writes per bank
+CARD_WRITE_LOCK_NAMESPACE = 4201
+
+# Currency symbols, percentage signs and thousands separators dropped before float()
+DECIMAL_STRIP_TABLE = str.maketrans("", "", "$%,")
+
+
+@lru_cache(maxsize=1024)
+def _parse_decimal_string(value):
+    """Parse a fee or rate string, memoized since the same values recur.
+
+    Parameters
+    ----------
+    value : str
+        Value that may contain currency symbols, separators or percentages
+
+    Returns
+    -------
+    float
+        Parsed decimal value, 0.0 if the string is not numeric
+    """
+    # float() already ignores surrounding whitespace
+    try:
+        return float(value.translate(DECIMAL_STRIP_TABLE))
+    except ValueError:
+        return 0.0
+
 
 class CreditCardDataService:
     """Service for updating credit card data in the database.
@@ -29,22 +83,198 @@ class CreditCardDataService:
         int
             Number of credit cards successfully updated or created
         """
-        logger.info(f"Raw parsed data received for bank {bank_id}: {parsed_data}")
+        # Card payloads can be large; only build their repr when debugging
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug(f"Raw parsed data received for bank {bank_id}: {parsed_data}")
         normalized_data = self._normalize_parsed_data(parsed_data)
-        logger.info(f"Normalized data: {normalized_data}")
+        if debug_enabled:
+            logger.debug(f"Normalized data: {normalized_data}")
         updated_count = 0
 
         logger.info(f"Processing {len(normalized_data)} credit cards for bank {bank_id}")
+        cards = self._build_cards(bank_id, normalized_data)
+        if cards:
+            try:
+                updated_count = self._bulk_upsert_cards(cards)
+            except Exception as e:
+                logger.error(f"Bulk upsert failed, retrying cards one by one: {str(e)}")
+                updated_count = self._update_cards_individually(bank_id, normalized_data)
+
+        logger.info(f"Processed {updated_count} credit cards for bank {bank_id}")
+        return updated_count
+
+    def _build_cards(self, bank_id, normalized_data):
+        """Build unsaved credit card instances from normalized card data.
+
+        Parameters
+        ----------
+        bank_id : int
+            ID of the bank to associate credit cards with
+        normalized_data : list
+            Normalized list of credit card data dictionaries
+
+        Returns
+        -------
+        list of CreditCard
+            Unsaved instances, one per valid card entry
+        """
+        cards = []
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         for i, card_data in enumerate(normalized_data):
             try:
-                logger.info(f"Processing card {i+1}: {card_data}")
-                updated_count += self._update_single_card(bank_id, card_data)
+                if debug_enabled:
+                    logger.debug(f"Processing card {i+1}: {card_data}")
+                card_name = self._resolve_card_name(card_data)
+                defaults = self._prepare_card_defaults(card_data)
+                cards.append(CreditCard(bank_id=bank_id, name=card_name, **defaults))
             except Exception as e:
                 logger.error(f"Error updating credit card data: {str(e)}")
-                continue
+        return cards
 
-        logger.info(f"Total cards processed: {updated_count}")
-        return updated_count
+    def _bulk_upsert_cards(self, cards):
+        """Insert or update credit cards in a single statement.
+
+        Parameters
+        ----------
+        cards : list of CreditCard
+            Unsaved instances keyed by bank and name
+
+        Returns
+        -------
+        int
+            Number of card entries written
+        """
+        # A row may only be upserted once per statement; the last entry wins,
+        # matching the sequential update_or_create behaviour
+        unique_cards = list({card.name: card for card in cards}.values())
+        update_fields = list(CARD_UPDATE_FIELDS)
+
+        with transaction.atomic():
+            self._lock_bank_cards(unique_cards[0].bank_id)
+            if connection.features.supports_update_conflicts_with_target:
+                CreditCard.objects.bulk_create(
+                    unique_cards,
+                    update_conflicts=True,
+                    unique_fields=["bank", "name"],
+                    update_fields=update_fields,
+                    batch_size=UPSERT_BATCH_SIZE,
+                )
+            else:
+                self._bulk_create_or_update_cards(unique_cards, update_fields)
+
+        logger.debug(f"Upserted {len(unique_cards)} credit cards")
+        return len(cards)
+
+    def _lock_bank_cards(self, bank_id):
+        """Serialize card writes for a bank until the current transaction ends.
+
+        Workers crawling different sources of the same bank would otherwise
+        upsert overlapping (bank, name) rows concurrently and can deadlock.
+        The lock waits rather than skipping, since each source carries its
+        own cards. No-op on databases without advisory locks.
+
+        Parameters
+        ----------
+        bank_id : int
+            ID of the bank whose cards are about to be written
+        """
+        if connection.vendor != "postgresql":
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_advisory_xact_lock(%s, %s)",
+                [CARD_WRITE_LOCK_NAMESPACE, bank_id],
+            )
+
+    def _bulk_create_or_update_cards(self, cards, update_fields):
+        """Write cards with one bulk insert and one bulk update.
+
+        Used on database backends that cannot target ON CONFLICT at the
+        (bank, name) constraint.
+
+        Parameters
+        ----------
+        cards : list of CreditCard
+            Unsaved instances for a single bank, unique by name
+        update_fields : list of str
+            Fields to overwrite on cards that already exist
+        """
+        existing_ids = dict(
+            CreditCard.objects.filter(
+                bank_id=cards[0].bank_id, name__in=[card.name for card in cards]
+            ).values_list("name", "id")
+        )
+        to_create, to_update = [], []
+        now = timezone.now()
+        for card in cards:
+            if card.name in existing_ids:
+                card.pk = existing_ids[card.name]
+                card.modified = now
+                to_update.append(card)
+            else:
+                to_create.append(card)
+
+        CreditCard.objects.bulk_create(to_create, batch_size=UPSERT_BATCH_SIZE)
+        CreditCard.objects.bulk_update(
+            to_update, update_fields, batch_size=UPSERT_BATCH_SIZE
+        )
+        logger.debug(
+            f"Created {len(to_create)} and updated {len(to_update)} credit cards"
+        )
+
+    def _update_cards_individually(self, bank_id, normalized_data):
+        """Update or create credit cards one row at a time.
+
+        Parameters
+        ----------
+        bank_id : int
+            ID of the bank to associate credit cards with
+        normalized_data : list
+            Normalized list of credit card data dictionaries
+
+        Returns
+        -------
+        int
+            Number of credit cards successfully updated or created
+        """
+        named_cards = []
+        for card_data in normalized_data:
+            try:
+                named_cards.append((self._resolve_card_name(card_data), card_data))
+            except Exception as e:
+                logger.error(f"Error updating credit card data: {str(e)}")
+
+        # One lookup up front lets each card be a single UPDATE or INSERT
+        existing_ids = dict(
+            CreditCard.objects.filter(
+                bank_id=bank_id, name__in=[name for name, _ in named_cards]
+            ).values_list("name", "id")
+        )
+        created_count = updated_count = 0
+        # One commit for the whole batch; the per-card savepoint rolls back
+        # only the failing card
+        with transaction.atomic():
+            self._lock_bank_cards(bank_id)
+            for card_name, card_data in named_cards:
+                try:
+                    with transaction.atomic():
+                        created = self._update_single_card(
+                            bank_id, card_name, card_data, existing_ids
+                        )
+                except Exception as e:
+                    logger.error(f"Error updating credit card data: {str(e)}")
+                    continue
+                if created:
+                    created_count += 1
+                else:
+                    updated_count += 1
+
+        logger.info(
+            f"Saved cards one by one for bank {bank_id}: "
+            f"{created_count} created, {updated_count} updated"
+        )
+        return created_count + updated_count
 
     def _normalize_parsed_data(self, parsed_data):
         """Normalize parsed data to a list format.
@@ -61,39 +291,77 @@ class CreditCardDataService:
         """
         if isinstance(parsed_data, list):
             return parsed_data
-        elif isinstance(parsed_data, dict):
-            # Handle validation error structure: {"validation_errors": [...], "data": [...]}
-            if "data" in parsed_data:
-                logger.info("Processing data despite validation warnings")
-                data_to_process = parsed_data["data"]
-                if isinstance(data_to_process, list):
-                    return data_to_process
-                else:
-                    return self._normalize_parsed_data(data_to_process)
-            # Handle standard structure: {"credit_cards": [...]}
-            elif "credit_cards" in parsed_data:
-                return parsed_data["credit_cards"]
-            else:
-                logger.warning("Parsed data dict does not contain expected keys")
-                return []
-        else:
+        if not isinstance(parsed_data, dict):
             logger.warning("Parsed data is not in expected format")
             return []
 
-    def _update_single_card(self, bank_id, card_data):
+        # Handle validation error structure: {"validation_errors": [...], "data": [...]}
+        if "data" in parsed_data:
+            logger.info("Processing data despite validation warnings")
+            return self._normalize_parsed_data(parsed_data["data"])
+
+        # Handle standard structure: {"credit_cards": [...]}
+        cards = parsed_data.get("credit_cards")
+        if cards is None:
+            logger.warning("Parsed data dict does not contain expected keys")
+            return []
+        return cards
+
+    def _update_single_card(self, bank_id, card_name, card_data, existing_ids):
         """Update or create a single credit card record.
 
         Parameters
         ----------
         bank_id : int
             ID of the bank to associate the card with
+        card_name : str
+            Resolved name of the card
         card_data : dict
             Dictionary containing credit card information and attributes
+        existing_ids : dict
+            Mapping of card name to ID for the bank's existing cards; updated
+            in place when a card is created
 
         Returns
         -------
-        int
-            1 if card was successfully updated or created, 0 otherwise
+        bool
+            True if the card was created, False if an existing card was updated
+        """
+        try:
+            defaults = self._prepare_card_defaults(card_data)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Creating/updating card '{card_name}' for bank {bank_id} with defaults: {defaults}"
+                )
+
+            card_id = existing_ids.get(card_name)
+            if card_id is None:
+                card = CreditCard.objects.create(
+                    bank_id=bank_id, name=card_name, **defaults
+                )
+                existing_ids[card_name] = card.id
+                return True
+
+            CreditCard.objects.filter(pk=card_id).update(
+                modified=timezone.now(), **defaults
+            )
+            return False
+        except Exception as e:
+            logger.error(f"Failed to create/update credit card '{card_name}': {str(e)}")
+            raise
+
+    def _resolve_card_name(self, card_data):
+        """Return a usable card name, replacing missing or fee-like names.
+
+        Parameters
+        ----------
+        card_data : dict
+            Dictionary containing credit card information and attributes
+
+        Returns
+        -------
+        str
+            Stripped card name, or a fallback derived from the annual fee
         """
         card_name = card_data.get("name", "").strip()
         if not card_name:
@@ -102,34 +370,11 @@ class CreditCardDataService:
             card_name = f"Credit Card (Annual Fee: {annual_fee})"
             logger.warning(f"Credit card name is missing, using fallback: {card_name}")
         # Clean up card name if it's just the annual fee
-        elif (
-            card_name.startswith("TK.")
-            or card_name.startswith("US$")
-            or card_name.replace(",", "").replace(".", "").isdigit()
-        ):
+        elif FEE_LIKE_NAME_RE.match(card_name):
             annual_fee = card_data.get("annual_fee", 0)
             card_name = f"Credit Card (Annual Fee: {annual_fee})"
-            logger.info(f"Cleaned up card name from fee to: {card_name}")
-
-        try:
-            defaults = self._prepare_card_defaults(card_data)
-            logger.info(
-                f"Creating/updating card '{card_name}' for bank {bank_id} with defaults: {defaults}"
-            )
-
-            card, created = CreditCard.objects.update_or_create(
-                bank_id=bank_id,
-                name=card_name,
-                defaults=defaults,
-            )
-
-            logger.info(
-                f"{'Created' if created else 'Updated'} credit card: {card.name} (ID: {card.id})"
-            )
-            return 1
-        except Exception as e:
-            logger.error(f"Failed to create/update credit card '{card_name}': {str(e)}")
-            raise
+            logger.debug(f"Cleaned up card name from fee to: {card_name}")
+        return card_name
 
     def _prepare_card_defaults(self, card_data):
         """Prepare default values for credit card creation/update.
@@ -178,11 +423,6 @@ class CreditCardDataService:
             return float(value)
 
         if isinstance(value, str):
-            # Remove currency symbols and percentage signs
-            cleaned = value.replace("$", "").replace("%", "").replace(",", "").strip()
-            try:
-                return float(cleaned)
-            except ValueError:
-                return 0.0
+            return _parse_decimal_string(value)
 
         return 0.0
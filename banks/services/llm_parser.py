@@ -5,17 +5,145 @@ This module provides LLM parsing service that uses the LLM orchestrator
 with automatic fallback and comprehensive error handling.
 """
 
-import json
+import copy
 import logging
 import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+
+import orjson
+import xxhash
+
+from django.conf import settings
+from django.core.cache import cache
 
 from banks.exceptions import AIParsingError, ConfigurationError
+from banks.utils import collapse_layout_whitespace
 from banks.validators import CreditCardDataValidator
 from common.llm import LLMOrchestrator
 from common.llm.exceptions import AllLLMProvidersFailedError
 
 logger = logging.getLogger(__name__)
 
+# Futures of parses currently running, by cache key, shared across parsers
+_inflight_parses = {}
+_inflight_parses_lock = threading.Lock()
+
+# Part of every parse cache key; bump whenever prompts, schemas or result
+# processing change so results cached under the old behaviour are not reused
+PROMPT_VERSION = 1
+
+# Output token ceilings per bank and per comprehensive parse
+BANK_RESPONSE_MAX_TOKENS = 4000
+COMPREHENSIVE_MAX_TOKENS = 8000
+
+# Below the ceilings, output budgets scale with the content: card JSON repeats
+# every field name per card, so it can be several times longer than a compact
+# fee table, but never needs more than a small floor for a short page
+RESPONSE_TOKENS_PER_CONTENT_TOKEN = 3
+MIN_RESPONSE_TOKENS = 1500
+
+# Word runs and single punctuation marks, a close proxy for BPE token counts on
+# fee tables; used to budget prompt content without a tokenizer download
+TOKEN_ESTIMATE_RE = re.compile(r"\w+|[^\w\s]")
+
+# A response wrapped in one ```json fence, and the outermost JSON value in
+# free text around it
+FENCED_JSON_RE = re.compile(
+    r"^\s*```(?:json)?\s*(.*?)\s*```\s*$", re.IGNORECASE | re.DOTALL
+)
+JSON_BODY_RE = re.compile(r"[\[\{].*[\]\}]", re.DOTALL)
+
+CREDIT_CARD_FIELD_INSTRUCTIONS = """Extract these fields for each credit card with EXACT formats:
+- name: Credit card name/type (e.g., "Platinum Card", "Gold Card", "Classic Card", "World Card", etc.) - NOT the annual fee amount
+- annual_fee: Annual fee as pure number without currency (e.g., "TK. 5,000" becomes 5000, "Free" becomes 0)
+- interest_rate_apr: Interest rate as decimal number (e.g., "20%" becomes 20.0, "17%" becomes 17.0)
+- lounge_access_international: Lounge access description as string (e.g., "10 complimentary visits", "Unlimited", or "" if none)
+- lounge_access_domestic: Lounge access description as string (e.g., "Unlimited visits for cardholder only", or "" if none)
+- lounge_access_condition: Conditions or requirements for lounge access as string (e.g., "Available for primary cardholders only", "Valid for first 3 years", or "" if none)
+- cash_advance_fee: Fee description as string
+- late_payment_fee: Fee description as string
+- annual_fee_waiver_policy: Waiver conditions as simple string (or null if not available)
+- reward_points_policy: Reward policy description as string or null
+- additional_features: Array of feature strings or null
+
+CRITICAL: Follow these number conversion rules strictly:
+- Remove ALL currency symbols and text (TK., BDT, USD, $)
+- Remove ALL commas and spaces from numbers
+- Convert percentages to decimals (20% → 20.0, not "20%")
+- Convert "Free" to 0, "Unlimited" to null for numeric fields
+"""
+
+# Gemini response schema mirroring CREDIT_CARD_FIELD_INSTRUCTIONS, so the decoder
+# can only emit card objects of that shape
+CREDIT_CARD_RESPONSE_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+            "annual_fee": {"type": "number", "nullable": True},
+            "interest_rate_apr": {"type": "number", "nullable": True},
+            "lounge_access_international": {"type": "string", "nullable": True},
+            "lounge_access_domestic": {"type": "string", "nullable": True},
+            "lounge_access_condition": {"type": "string", "nullable": True},
+            "cash_advance_fee": {"type": "string", "nullable": True},
+            "late_payment_fee": {"type": "string", "nullable": True},
+            "annual_fee_waiver_policy": {"type": "string", "nullable": True},
+            "reward_points_policy": {"type": "string", "nullable": True},
+            "additional_features": {
+                "type": "array",
+                "items": {"type": "string"},
+                "nullable": True,
+            },
+        },
+        "required": ["name"],
+    },
+}
+
+# Prompt preambles are kept free of per-call values so every request shares the
+# same prefix, which providers can serve from their prompt cache
+CREDIT_CARD_PARSING_INSTRUCTIONS = f"""
+You are a data extraction AI. Extract credit card information from the content at the
+end of this prompt, for the bank named in the ==BANK== section.
+
+CRITICAL INSTRUCTIONS:
+1. You MUST respond with ONLY valid JSON - no markdown, no explanations, no code blocks
+2. Start your response immediately with [ and end with ]
+3. Do not use ```json or ``` or any other formatting
+4. Ensure the JSON is complete and properly closed
+
+{CREDIT_CARD_FIELD_INSTRUCTIONS}
+Return format: JSON array of objects. If no credit cards found, return []"""
+
+
+COMPREHENSIVE_PARSING_INSTRUCTIONS = """
+You are a comprehensive data extraction AI. Extract ALL available information from the
+credit card document at the end of this prompt, for the bank named in the ==BANK== section.
+
+CRITICAL FORMATTING RULES:
+1. You MUST respond with ONLY valid JSON - no markdown, no explanations, no code blocks
+2. Start your response immediately with [ and end with ]
+3. Do not use ```json or ``` or any other formatting
+4. Ensure the JSON is complete and properly closed
+5. If content is too long, prioritize completeness of objects over quantity
+
+EXTRACTION INSTRUCTIONS:
+1. For credit card model fields, use these exact field names:
+   - name, annual_fee, interest_rate_apr, lounge_access_international, lounge_access_domestic, lounge_access_condition
+   - cash_advance_fee, late_payment_fee, annual_fee_waiver_policy, reward_points_policy, additional_features
+
+2. For any other data found, use the column header/title as key:
+   - Example: "CIB Fee" -> "CIB Fee": "BDT 100"
+   - Example: "Processing Fee" -> "Processing Fee": "2%"
+
+3. Extract data for each credit card type (World, Platinum, Gold, Classic, etc.)
+
+4. Include ALL charges, fees, benefits, policies mentioned
+
+5. Return as JSON array where each object represents one credit card"""
+
 
 class LLMContentParser:
     """Enhanced LLM parser with orchestrator-based architecture.
@@ -45,6 +173,43 @@ class LLMContentParser:
             Parsed and validated credit card data containing structured
             information about credit cards found in the content
 
+        Raises
+        ------
+        AIParsingError
+            If all LLM providers fail or return invalid data
+        ConfigurationError
+            If no LLM providers are configured
+        """
+        if not self._has_parseable_content(content, bank_name):
+            return self._create_skipped_result()
+
+        cache_key = self._build_cache_key(content, bank_name)
+        cached_result = cache.get(cache_key)
+        if cached_result is not None:
+            logger.info(f"Reusing cached credit card parse for {bank_name}")
+            return cached_result
+
+        return self._run_coalesced(
+            cache_key, lambda: self._parse_and_cache_cards(content, bank_name, cache_key)
+        )
+
+    def _parse_and_cache_cards(self, content, bank_name, cache_key):
+        """Parse credit card data with the LLM and cache a non-empty result.
+
+        Parameters
+        ----------
+        content : str
+            Extracted text content to parse
+        bank_name : str
+            Name of the bank for context
+        cache_key : str
+            Cache key the result is stored under
+
+        Returns
+        -------
+        dict
+            Parsed and validated credit card data
+
         Raises
         ------
         AIParsingError
@@ -55,10 +220,14 @@ class LLMContentParser:
         self._validate_orchestrator_availability()
 
         try:
-            llm_result = self._generate_llm_response(content, bank_name)
-            parsed_data = self._clean_and_parse_response(llm_result["response"])
+            parsed_data, provider = self._generate_chunked_cards(
+                content, bank_name, self._generate_llm_response
+            )
 
-            return self._process_parsed_data(parsed_data, llm_result["provider"])
+            result = self._process_parsed_data(parsed_data, provider)
+            if self._is_cacheable_result(result):
+                cache.set(cache_key, result, timeout=settings.LLM_CACHE_TTL)
+            return result
 
         except AllLLMProvidersFailedError as e:
             self._handle_provider_failures(e)
@@ -66,6 +235,50 @@ class LLMContentParser:
             logger.error(f"Unexpected error in credit card parsing: {e}")
             raise AIParsingError(f"Unexpected error during parsing: {str(e)}") from e
 
+    def _estimate_response_tokens(self, content, max_tokens):
+        """Estimate the output token budget needed to parse content.
+
+        Parameters
+        ----------
+        content : str
+            Content the response is generated from
+        max_tokens : int
+            Ceiling for the budget
+
+        Returns
+        -------
+        int
+            RESPONSE_TOKENS_PER_CONTENT_TOKEN times the estimated content tokens,
+            bounded by MIN_RESPONSE_TOKENS and ``max_tokens``
+        """
+        content_tokens = self._estimate_tokens(
+            content, max_tokens // RESPONSE_TOKENS_PER_CONTENT_TOKEN
+        )
+        return min(
+            max_tokens,
+            max(MIN_RESPONSE_TOKENS, content_tokens * RESPONSE_TOKENS_PER_CONTENT_TOKEN),
+        )
+
+    def _estimate_tokens(self, content, limit):
+        """Estimate the number of tokens in content, counting up to a limit.
+
+        Parameters
+        ----------
+        content : str
+            Document content to measure
+        limit : int
+            Count at which to stop scanning
+
+        Returns
+        -------
+        int
+            Estimated token count, or ``limit + 1`` if the content exceeds it
+        """
+        # Every estimated token spans at least one character
+        if len(content) <= limit:
+            return len(TOKEN_ESTIMATE_RE.findall(content))
+        return sum(1 for _ in islice(TOKEN_ESTIMATE_RE.finditer(content), limit + 1))
+
     def parse_comprehensive_data(self, content, bank_name):
         """Parse comprehensive data from content using enhanced extraction.
 
@@ -87,27 +300,60 @@ class LLMContentParser:
         AIParsingError
             If parsing fails or returns insufficient data
         """
+        if not self._has_parseable_content(content, bank_name):
+            return [], {"provider_used": None}
+
+        cache_key = self._build_cache_key(content, bank_name, kind="comprehensive")
+        cached_result = cache.get(cache_key)
+        if cached_result is not None:
+            logger.info(f"Reusing cached comprehensive parse for {bank_name}")
+            return cached_result
+
+        return self._run_coalesced(
+            cache_key,
+            lambda: self._parse_and_cache_comprehensive(content, bank_name, cache_key),
+        )
+
+    def _parse_and_cache_comprehensive(self, content, bank_name, cache_key):
+        """Parse comprehensive data with the LLM and cache a non-empty result.
+
+        Parameters
+        ----------
+        content : str
+            Text content to analyze comprehensively
+        bank_name : str
+            Bank name for prompt contextualization
+        cache_key : str
+            Cache key the result is stored under
+
+        Returns
+        -------
+        tuple of (dict, dict)
+            Comprehensive parsed data and metadata including provider used
+
+        Raises
+        ------
+        AIParsingError
+            If parsing fails or returns insufficient data
+        ConfigurationError
+            If no LLM providers are configured
+        """
         if not self.orchestrator.is_any_provider_available():
             raise ConfigurationError(
                 "No LLM providers are available for comprehensive parsing"
             )
 
         try:
-            result = self.orchestrator.generate_response(
-                prompt=self._build_comprehensive_parsing_prompt(content, bank_name),
-                max_retries=1,
-                temperature=0.1,
-                max_tokens=8000,  # Higher token limit for comprehensive parsing
+            # Long documents are parsed in chunks whose records are merged by name
+            parsed_data, used_provider = self._generate_chunked_cards(
+                content, bank_name, self._generate_comprehensive_response
             )
 
-            raw_response = result["response"]
-            used_provider = result["provider"]
-
-            # Clean and parse the comprehensive response
-            parsed_data = self._clean_and_parse_response(raw_response)
-
             logger.info(f"Comprehensive parsing completed using {used_provider}")
-            return parsed_data, {"provider_used": used_provider}
+            result = parsed_data, {"provider_used": used_provider}
+            if self._is_cacheable_comprehensive_result(parsed_data):
+                cache.set(cache_key, result, timeout=settings.LLM_CACHE_TTL)
+            return result
 
         except AllLLMProvidersFailedError as e:
             logger.error(f"All LLM providers failed for comprehensive parsing: {e}")
@@ -140,22 +386,23 @@ class LLMContentParser:
             If response cannot be parsed as valid JSON
         """
         try:
-            # Clean markdown formatting if present
-            cleaned_response = re.sub(r"```json\s*|\s*```", "", raw_response.strip())
-            cleaned_response = cleaned_response.strip()
+            # Unwrap a markdown code fence if the whole response is one; providers
+            # already strip replies and orjson ignores surrounding whitespace
+            fence_match = FENCED_JSON_RE.match(raw_response)
+            cleaned_response = fence_match.group(1) if fence_match else raw_response
 
             # Ensure it starts with [ or { for JSON
-            if not (cleaned_response.startswith("[") or cleaned_response.startswith("{")):
+            if not cleaned_response.startswith(("[", "{")):
                 # Try to find JSON in the response
-                json_match = re.search(r"([\[\{].*[\]\}])", cleaned_response, re.DOTALL)
+                json_match = JSON_BODY_RE.search(cleaned_response)
                 if json_match:
-                    cleaned_response = json_match.group(1)
+                    cleaned_response = json_match.group()
                 else:
                     raise AIParsingError("No valid JSON found in LLM response")
 
-            return json.loads(cleaned_response)
+            return orjson.loads(cleaned_response)
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON response: {e}")
             logger.debug(f"Raw response: {raw_response[:500]}...")
             raise AIParsingError(f"Invalid JSON response from LLM: {str(e)}") from e
@@ -175,81 +422,195 @@ class LLMContentParser:
         str
             Formatted prompt with instructions and content for LLM
         """
-        return f"""
-You are a data extraction AI. Extract credit card information from the following content for {bank_name}.
+        content = self._fit_content_to_token_budget(
+            collapse_layout_whitespace(content), settings.LLM_MAX_CONTENT_TOKENS
+        )
+        return (
+            f"{CREDIT_CARD_PARSING_INSTRUCTIONS}\n\n"
+            f"==BANK==\n{bank_name}\n==CONTENT==\n{content}"
+        )
 
-CRITICAL INSTRUCTIONS:
-1. You MUST respond with ONLY valid JSON - no markdown, no explanations, no code blocks
-2. Start your response immediately with [ and end with ]
-3. Do not use ```json or ``` or any other formatting
-4. Ensure the JSON is complete and properly closed
+    def _fit_content_to_token_budget(self, content, max_tokens):
+        """Cut content to an approximate token budget, preferring a line break.
 
-Extract these fields for each credit card with EXACT formats:
-- name: Credit card name/type (e.g., "Platinum Card", "Gold Card", "Classic Card", "World Card", etc.) - NOT the annual fee amount
-- annual_fee: Annual fee as pure number without currency (e.g., "TK. 5,000" becomes 5000, "Free" becomes 0)
-- interest_rate_apr: Interest rate as decimal number (e.g., "20%" becomes 20.0, "17%" becomes 17.0)
-- lounge_access_international: Lounge access description as string (e.g., "10 complimentary visits", "Unlimited", or "" if none)
-- lounge_access_domestic: Lounge access description as string (e.g., "Unlimited visits for cardholder only", or "" if none)
-- lounge_access_condition: Conditions or requirements for lounge access as string (e.g., "Available for primary cardholders only", "Valid for first 3 years", or "" if none)
-- cash_advance_fee: Fee description as string
-- late_payment_fee: Fee description as string
-- annual_fee_waiver_policy: Waiver conditions as simple string (or null if not available)
-- reward_points_policy: Reward policy description as string or null
-- additional_features: Array of feature strings or null
+        Parameters
+        ----------
+        content : str
+            Document content to embed in a prompt
+        max_tokens : int
+            Maximum number of estimated tokens to keep
 
-CRITICAL: Follow these number conversion rules strictly:
-- Remove ALL currency symbols and text (TK., BDT, USD, $)
-- Remove ALL commas and spaces from numbers
-- Convert percentages to decimals (20% → 20.0, not "20%")
-- Convert "Free" to 0, "Unlimited" to null for numeric fields
+        Returns
+        -------
+        str
+            The content unchanged if it fits, otherwise its longest prefix
+            within the budget
+        """
+        cut = self._find_token_budget_cut(content, max_tokens)
+        if cut is None:
+            return content
 
-Return format: JSON array of objects. If no credit cards found, return []
+        logger.warning(
+            f"Content exceeds {max_tokens} estimated tokens, truncated from "
+            f"{len(content)} to {cut} characters"
+        )
+        return content[:cut]
 
-Content to analyze:
-{content}"""
+    def _find_token_budget_cut(self, content, max_tokens):
+        """Find where content must be cut to fit an approximate token budget.
 
-    def _build_comprehensive_parsing_prompt(self, content, bank_name):
-        """Build the prompt for comprehensive LLM parsing to extract all available data.
+        Parameters
+        ----------
+        content : str
+            Document content to embed in a prompt
+        max_tokens : int
+            Maximum number of estimated tokens to keep
+
+        Returns
+        -------
+        int or None
+            Character offset to cut at, moved back to the last line break when
+            one falls in the later half, or None if the content fits
+        """
+        # Every estimated token spans at least one character
+        if len(content) <= max_tokens:
+            return None
+
+        overflow = next(
+            islice(TOKEN_ESTIMATE_RE.finditer(content), max_tokens, None), None
+        )
+        if overflow is None:
+            return None
+
+        cut = overflow.start()
+        line_end = content.rfind("\n", 0, cut)
+        return line_end if line_end > cut // 2 else cut
+
+    def _split_content(self, content, max_tokens, max_chunks):
+        """Split content into chunks that each fit an approximate token budget.
 
         Parameters
         ----------
         content : str
-            Text content to analyze comprehensively
+            Document content to split
+        max_tokens : int
+            Maximum number of estimated tokens per chunk
+        max_chunks : int
+            Maximum number of chunks; content past the last chunk is dropped
+
+        Returns
+        -------
+        list of str
+            Consecutive chunks of the content, cut at line breaks where possible
+        """
+        chunks = []
+        while content and len(chunks) < max_chunks:
+            cut = self._find_token_budget_cut(content, max_tokens)
+            if cut is None:
+                chunks.append(content)
+                return chunks
+            chunks.append(content[:cut])
+            content = content[cut:].lstrip()
+
+        if content:
+            logger.warning(
+                f"Content exceeds {max_chunks} chunks of {max_tokens} estimated "
+                f"tokens, dropped the last {len(content)} characters"
+            )
+        return chunks
+
+    def _generate_chunked_cards(self, content, bank_name, generate_response):
+        """Parse content with one LLM request per chunk and merge the cards.
+
+        Content within the token budget is sent as a single prompt. Larger
+        content is split into chunks parsed concurrently, and cards found in
+        several chunks are merged by name, with later chunks only filling
+        fields the earlier ones left empty.
+
+        Parameters
+        ----------
+        content : str
+            Content to analyze
         bank_name : str
-            Bank name for prompt contextualization
+            Bank name for context
+        generate_response : callable
+            Takes a content chunk and the bank name and returns the LLM
+            response dict with provider information
 
         Returns
         -------
-        str
-            Formatted comprehensive parsing prompt for maximum data extraction
+        tuple of (list or None, str)
+            Parsed card entries and the provider of the first response
         """
-        return f"""
-You are a comprehensive data extraction AI. Extract ALL available information from this {bank_name} credit card document.
+        chunks = self._split_content(
+            collapse_layout_whitespace(content),
+            settings.LLM_MAX_CONTENT_TOKENS,
+            settings.LLM_MAX_CONTENT_CHUNKS,
+        )
+        if len(chunks) <= 1:
+            llm_result = generate_response(content, bank_name)
+            return (
+                self._clean_and_parse_response(llm_result["response"]),
+                llm_result["provider"],
+            )
 
-CRITICAL FORMATTING RULES:
-1. You MUST respond with ONLY valid JSON - no markdown, no explanations, no code blocks
-2. Start your response immediately with [ and end with ]
-3. Do not use ```json or ``` or any other formatting
-4. Ensure the JSON is complete and properly closed
-5. If content is too long, prioritize completeness of objects over quantity
+        logger.info(f"Parsing {bank_name} content in {len(chunks)} chunks")
+        max_workers = min(len(chunks), settings.LLM_MAX_CONCURRENT_REQUESTS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            llm_results = list(
+                executor.map(lambda chunk: generate_response(chunk, bank_name), chunks)
+            )
 
-EXTRACTION INSTRUCTIONS:
-1. For credit card model fields, use these exact field names:
-   - name, annual_fee, interest_rate_apr, lounge_access_international, lounge_access_domestic, lounge_access_condition
-   - cash_advance_fee, late_payment_fee, annual_fee_waiver_policy, reward_points_policy, additional_features
+        cards = {}
+        for llm_result in llm_results:
+            parsed_data = self._clean_and_parse_response(llm_result["response"])
+            if isinstance(parsed_data, list):
+                self._merge_cards_by_name(cards, parsed_data)
+        return list(cards.values()), llm_results[0]["provider"]
 
-2. For any other data found, use the column header/title as key:
-   - Example: "CIB Fee" -> "CIB Fee": "BDT 100"
-   - Example: "Processing Fee" -> "Processing Fee": "2%"
+    def _merge_cards_by_name(self, cards, parsed_data):
+        """Merge parsed card entries into cards collected from earlier chunks.
 
-3. Extract data for each credit card type (World, Platinum, Gold, Classic, etc.)
+        Parameters
+        ----------
+        cards : dict
+            Mapping of card name to merged card data, updated in place
+        parsed_data : list
+            Card entries parsed from one chunk
+        """
+        for card_data in parsed_data:
+            if not isinstance(card_data, dict):
+                continue
+            name = str(card_data.get("name") or "").strip()
+            if not name:
+                continue
+            merged = cards.setdefault(name, dict(card_data))
+            for field, value in card_data.items():
+                if merged.get(field) in (None, "", []):
+                    merged[field] = value
 
-4. Include ALL charges, fees, benefits, policies mentioned
+    def _build_comprehensive_parsing_prompt(self, content, bank_name):
+        """Build the prompt for comprehensive LLM parsing to extract all available data.
 
-5. Return as JSON array where each object represents one credit card
+        Parameters
+        ----------
+        content : str
+            Text content to analyze comprehensively
+        bank_name : str
+            Bank name for prompt contextualization
 
-Content to analyze:
-{content}"""
+        Returns
+        -------
+        str
+            Formatted comprehensive parsing prompt for maximum data extraction
+        """
+        content = self._fit_content_to_token_budget(
+            collapse_layout_whitespace(content), settings.LLM_MAX_CONTENT_TOKENS
+        )
+        return (
+            f"{COMPREHENSIVE_PARSING_INSTRUCTIONS}\n\n"
+            f"==BANK==\n{bank_name}\n==CONTENT==\n{content}"
+        )
 
     def get_orchestrator_status(self):
         """Get the current status of the LLM orchestrator.
@@ -270,23 +631,27 @@ Content to analyze:
             Test results for each provider
         """
         test_prompt = "Respond with exactly: OK"
-        results = {}
+        provider_names = list(self.orchestrator.providers)
+        if not provider_names:
+            return {}
 
-        for provider_name in self.orchestrator.providers:
+        def check_one(provider_name):
             try:
                 result = self.orchestrator.generate_response(
                     prompt=test_prompt,
                     preferred_provider=provider_name,
                     max_retries=0,  # Don't retry for testing
                 )
-                results[provider_name] = {
+                return {
                     "status": "success",
                     "response": result["response"][:50],  # First 50 chars
                 }
             except Exception as e:
-                results[provider_name] = {"status": "failed", "error": str(e)}
+                return {"status": "failed", "error": str(e)}
 
-        return results
+        # Probe every provider at once so the check takes the slowest round trip
+        with ThreadPoolExecutor(max_workers=len(provider_names)) as executor:
+            return dict(zip(provider_names, executor.map(check_one, provider_names)))
 
     def _validate_orchestrator_availability(self):
         """Validate that LLM orchestrator is available.
@@ -301,6 +666,119 @@ Content to analyze:
                 "No LLM providers are available for credit card parsing"
             )
 
+    def _run_coalesced(self, key, parse):
+        """Run a parse once for all concurrent callers with the same cache key.
+
+        The first caller checks the cache again, since a previous owner may
+        have stored the result after this caller's lookup, and otherwise runs
+        ``parse``. Callers arriving while it is in flight wait for its result
+        or exception instead of sending a duplicate LLM request, and each
+        gets its own copy of the result.
+
+        Parameters
+        ----------
+        key : str
+            Cache key identifying the parse
+        parse : callable
+            Function performing the parse when no identical one is in flight
+
+        Returns
+        -------
+        object
+            Cached result for ``key`` or the result of ``parse``
+        """
+        with _inflight_parses_lock:
+            future = _inflight_parses.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                _inflight_parses[key] = future
+
+        if not is_owner:
+            logger.info("Waiting for an identical parse already in flight")
+            return copy.deepcopy(future.result())
+
+        try:
+            result = cache.get(key)
+            if result is None:
+                result = parse()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with _inflight_parses_lock:
+                del _inflight_parses[key]
+
+    def _is_cacheable_result(self, result):
+        """Check whether a structured parse result is good enough to reuse.
+
+        Parameters
+        ----------
+        result : dict
+            Processed result with credit cards and validation errors
+
+        Returns
+        -------
+        bool
+            True if cards were found and validation errors do not outnumber
+            them; mostly rejected parses are retried on the next crawl instead
+            of being pinned for LLM_CACHE_TTL
+        """
+        cards = result["credit_cards"]
+        return bool(cards) and len(result["validation_errors"]) <= len(cards)
+
+    def _is_cacheable_comprehensive_result(self, parsed_data):
+        """Check whether a comprehensive parse is good enough to reuse.
+
+        Parameters
+        ----------
+        parsed_data : list or dict
+            Comprehensive records parsed from the LLM response
+
+        Returns
+        -------
+        bool
+            True if records with a card name were found and do not get
+            outnumbered by records without one, the same bar structured
+            results must meet to be cached
+        """
+        if not isinstance(parsed_data, list):
+            return False
+        named = sum(
+            1
+            for record in parsed_data
+            if isinstance(record, dict) and str(record.get("name") or "").strip()
+        )
+        return named > 0 and len(parsed_data) - named <= named
+
+    def _build_cache_key(self, content, bank_name, kind="cc"):
+        """Build the cache key for a bank's parsed credit card data.
+
+        Parameters
+        ----------
+        content : str
+            Content being parsed
+        bank_name : str
+            Bank name the content belongs to
+        kind : str
+            Parse type the key belongs to, "cc" for structured credit card data
+            and "comprehensive" for comprehensive data
+
+        Returns
+        -------
+        str
+            Cache key derived from the prompt version and a hash of the bank
+            name and content
+        """
+        # Hash the content as it is sent, so layout-only whitespace changes
+        # that produce the same prompt also share its cached parse
+        content = collapse_layout_whitespace(content)
+        digest = xxhash.xxh3_128_hexdigest(f"{bank_name}|{content}".encode("utf-8"))
+        return f"llm:{kind}:v{PROMPT_VERSION}:{digest}"
+
     def _generate_llm_response(self, content, bank_name):
         """Generate LLM response using orchestrator.
 
@@ -320,7 +798,32 @@ Content to analyze:
             prompt=self._build_parsing_prompt(content, bank_name),
             max_retries=1,
             temperature=0.1,
-            max_tokens=4000,
+            max_tokens=self._estimate_response_tokens(content, BANK_RESPONSE_MAX_TOKENS),
+            json_mode=True,
+            response_schema=CREDIT_CARD_RESPONSE_SCHEMA,
+        )
+
+    def _generate_comprehensive_response(self, content, bank_name):
+        """Generate a comprehensive LLM response using orchestrator.
+
+        Parameters
+        ----------
+        content : str
+            Content to analyze comprehensively
+        bank_name : str
+            Bank name for context
+
+        Returns
+        -------
+        dict
+            LLM response with provider information
+        """
+        return self.orchestrator.generate_response(
+            prompt=self._build_comprehensive_parsing_prompt(content, bank_name),
+            max_retries=1,
+            temperature=0.1,
+            max_tokens=self._estimate_response_tokens(content, COMPREHENSIVE_MAX_TOKENS),
+            json_mode=True,
         )
 
     def _process_parsed_data(self, parsed_data, provider):
@@ -360,7 +863,17 @@ Content to analyze:
         validated_data = []
         validation_errors = []
 
-        for card_data in parsed_data:
+        for index, card_data in enumerate(parsed_data):
+            # Entries that cannot become a card skip sanitizing and validation
+            if not isinstance(card_data, dict):
+                validation_errors.append(f"Card {index + 1}: Invalid card data format")
+                continue
+            if not str(card_data.get("name") or "").strip():
+                validation_errors.append(
+                    f"Card {index + 1}: Credit card name is required"
+                )
+                continue
+
             try:
                 validated_card = self.validator.sanitize_credit_card_data(card_data)
                 is_valid, errors = self.validator.validate_credit_card_data(
@@ -376,6 +889,41 @@ Content to analyze:
 
         return validated_data, validation_errors
 
+    def _has_parseable_content(self, content, bank_name):
+        """Check whether content has any text worth an LLM request.
+
+        Parameters
+        ----------
+        content : str
+            Content to parse
+        bank_name : str
+            Bank name for logging context
+
+        Returns
+        -------
+        bool
+            True if the content is not empty or whitespace only
+        """
+        if content and not content.isspace():
+            return True
+
+        logger.info(f"Skipping LLM parsing for {bank_name}: content is empty")
+        return False
+
+    def _create_skipped_result(self):
+        """Create result for content skipped without an LLM request.
+
+        Returns
+        -------
+        dict
+            Empty result dictionary without a provider
+        """
+        return {
+            "credit_cards": [],
+            "provider_used": None,
+            "validation_errors": ["No content to parse"],
+        }
+
     def _create_empty_result(self, provider):
         """Create result for empty or invalid parsed data.
 
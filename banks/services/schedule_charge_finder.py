@@ -7,6 +7,8 @@ LLM orchestrator with automatic fallback and better error handling.
 
 import json
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 
 import requests
@@ -18,6 +20,22 @@ from common.llm.exceptions import AllLLMProvidersFailedError
 
 logger = logging.getLogger(__name__)
 
+# First URL in a free-text LLM answer
+URL_RE = re.compile(r"https?://\S+")
+
+# Link text or URL fragments that point at a schedule of charges page
+SCHEDULE_CHARGE_PATTERNS = [
+    re.compile(pattern)
+    for pattern in (
+        r"schedule.*charge",
+        r"fee.*schedule",
+        r"charges.*fee",
+        r"pricing",
+        r"tariff",
+        r"service.*charge",
+    )
+]
+
 
 class ScheduleChargeURLFinder:
     """Enhanced schedule charge URL finder with orchestrator-based LLM analysis.
@@ -217,17 +235,15 @@ class ScheduleChargeURLFinder:
                 return json.loads(raw_response.strip())
 
             # Fallback: extract URL from text response
-            import re
+            url_match = URL_RE.search(raw_response)
 
-            url_pattern = r"https?://[^\\s]+"
-            urls = re.findall(url_pattern, raw_response)
-
-            if urls:
+            if url_match:
+                url = url_match.group()
                 return {
                     "found": True,
-                    "url": urls[0],
+                    "url": url,
                     "method": "llm_text_extraction",
-                    "content_type": "PDF" if urls[0].endswith(".pdf") else "WEBPAGE",
+                    "content_type": "PDF" if url.endswith(".pdf") else "WEBPAGE",
                 }
 
             return {
@@ -260,23 +276,12 @@ class ScheduleChargeURLFinder:
             content_data = self._fetch_webpage_content(base_url)
 
             # Search for common patterns in links
-            charge_patterns = [
-                r"schedule.*charge",
-                r"fee.*schedule",
-                r"charges.*fee",
-                r"pricing",
-                r"tariff",
-                r"service.*charge",
-            ]
-
             for link in content_data["links"]:
                 link_text = link["text"].lower()
                 link_url = link["url"].lower()
 
-                for pattern in charge_patterns:
-                    import re
-
-                    if re.search(pattern, link_text) or re.search(pattern, link_url):
+                for pattern in SCHEDULE_CHARGE_PATTERNS:
+                    if pattern.search(link_text) or pattern.search(link_url):
                         return {
                             "found": True,
                             "url": link["url"],
@@ -284,7 +289,7 @@ class ScheduleChargeURLFinder:
                             "content_type": (
                                 "PDF" if link["url"].endswith(".pdf") else "WEBPAGE"
                             ),
-                            "pattern": pattern,
+                            "pattern": pattern.pattern,
                         }
 
             return {
@@ -370,18 +375,21 @@ If no suitable URL found, return: {{"found": false, "method": "llm_analysis", "e
         test_prompt = (
             "Find a URL from this list: https://example.com/fees.pdf - Example Bank Fees"
         )
-        results = {}
+        provider_names = list(self.orchestrator.providers)
+        if not provider_names:
+            return {}
 
-        for provider_name in self.orchestrator.providers:
+        def check_one(provider_name):
             try:
                 result = self.orchestrator.generate_response(
                     prompt=test_prompt, preferred_provider=provider_name, max_retries=0
                 )
-                results[provider_name] = {
+                return {
                     "status": "success",
                     "response": result["response"][:100],
                 }
             except Exception as e:
-                results[provider_name] = {"status": "failed", "error": str(e)}
+                return {"status": "failed", "error": str(e)}
 
-        return results
+        with ThreadPoolExecutor(max_workers=len(provider_names)) as executor:
+            return dict(zip(provider_names, executor.map(check_one, provider_names)))
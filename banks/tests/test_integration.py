@@ -387,8 +387,13 @@ class TestSystemScalabilityAndPerformance:
 
     @patch("banks.services.content_extractor.ContentExtractor.extract_content")
     @patch("banks.services.llm_parser.LLMContentParser.parse_comprehensive_data")
-    def test_crawling_performance_with_many_sources(self, mock_parse, mock_extract):
+    def test_crawling_performance_with_many_sources(
+        self, mock_parse, mock_extract, settings
+    ):
         """Test crawling performance with many data sources."""
+        # Worker threads cannot see this test's uncommitted transaction
+        settings.CRAWLER_MAX_WORKERS = 1
+
         # Mock successful responses
         mock_extract.return_value = ("Raw content", "Sample content")
         mock_parse.return_value = (
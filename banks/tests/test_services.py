@@ -32,7 +32,7 @@ class TestContentExtractor:
         """Test PDF content extraction."""
         # Mock PDF response
         mock_response = Mock()
-        mock_response.content = b"Mock PDF content"
+        mock_response.iter_content.return_value = [b"Mock PDF content"]
         mock_response.raise_for_status.return_value = None
         self.extractor.session.get.return_value = mock_response
 
@@ -61,7 +61,7 @@ class TestContentExtractor:
         """
 
         mock_response = Mock()
-        mock_response.content = html_content.encode()
+        mock_response.iter_content.return_value = [html_content.encode()]
         mock_response.text = html_content
         mock_response.raise_for_status.return_value = None
         self.extractor.session.get.return_value = mock_response
@@ -84,7 +84,7 @@ class TestContentExtractor:
         )
 
         mock_response = Mock()
-        mock_response.content = csv_content.encode()
+        mock_response.iter_content.return_value = [csv_content.encode()]
         mock_response.raise_for_status.return_value = None
         self.extractor.session.get.return_value = mock_response
 
@@ -113,8 +113,8 @@ class TestContentExtractor:
     )
     def test_detect_content_type(self, mime_type, expected_type):
         """Test content type detection."""
-        with patch("banks.services.content_extractor.magic") as mock_magic:
-            mock_magic.from_buffer.return_value = mime_type
+        with patch("banks.services.content_extractor.get_mime_detector") as mock_magic:
+            mock_magic.return_value.from_buffer.return_value = mime_type
             content_type = self.extractor._detect_content_type(b"test content")
             assert content_type == expected_type
 
@@ -1,16 +1,32 @@
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
 import pytest
 
+from django.core.cache import cache
+
 from banks.enums import ContentType
+from banks.exceptions import AIParsingError
 from banks.factories import BankDataSourceFactory, BankFactory
+from banks.models import BankDataSource
 from banks.services import (
     BankDataCrawlerService,
     ContentExtractor,
     CreditCardDataService,
     LLMContentParser,
 )
+from banks.services.credit_card_data_service import (
+    CARD_UPDATE_FIELDS,
+    CARD_WRITE_LOCK_NAMESPACE,
+)
+from banks.services.llm_parser import (
+    COMPREHENSIVE_PARSING_INSTRUCTIONS,
+    CREDIT_CARD_PARSING_INSTRUCTIONS,
+    MIN_RESPONSE_TOKENS,
+    PROMPT_VERSION,
+)
 from credit_cards.factories import CreditCardFactory
 from credit_cards.models import CreditCard
 
@@ -28,7 +44,7 @@ class TestContentExtractor:
         """Test PDF content extraction."""
         # Mock PDF response
         mock_response = Mock()
-        mock_response.content = b"Mock PDF content"
+        mock_response.iter_content.return_value = [b"Mock PDF content"]
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -58,7 +74,7 @@ class TestContentExtractor:
         """
 
         mock_response = Mock()
-        mock_response.content = html_content.encode()
+        mock_response.iter_content.return_value = [html_content.encode()]
         mock_response.text = html_content
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
@@ -74,6 +90,36 @@ class TestContentExtractor:
 
             assert "Credit Card Information" in extracted_content
 
+    def test_extract_webpage_content_collapses_whitespace(self):
+        """Test runs of spaces and blank lines are collapsed in page text."""
+        html = "<body><h1> Title </h1>\n\n<p>Fee:   $95\t now</p>\n  <p>Apply</p></body>"
+
+        assert self.extractor._extract_webpage_content(html) == (
+            "Title\nFee: $95 now\nApply"
+        )
+
+    def test_extract_webpage_content_caches_repeated_pages(self):
+        """Test identical pages are parsed once and then served from cache."""
+        html = b"<html><body><p>Titanium Card cache check</p></body></html>"
+
+        with patch.object(
+            self.extractor, "_html_to_text", wraps=self.extractor._html_to_text
+        ) as mock_parse:
+            first = self.extractor._extract_webpage_content(html)
+            second = self.extractor._extract_webpage_content(html)
+
+        assert first == second == "Titanium Card cache check"
+        mock_parse.assert_called_once()
+
+    def test_extract_webpage_content_honours_declared_charset(self):
+        """Test webpage bytes are parsed using the page's declared encoding."""
+        html_bytes = (
+            b'<html><head><meta charset="iso-8859-1"></head>'
+            b"<body><p>Caf\xe9 Rewards Card</p></body></html>"
+        )
+
+        assert self.extractor._extract_webpage_content(html_bytes) == "Café Rewards Card"
+
     @patch("banks.services.content_extractor.requests.Session.get")
     def test_extract_csv_content(self, mock_get):
         """Test CSV content extraction."""
@@ -82,7 +128,7 @@ class TestContentExtractor:
         )
 
         mock_response = Mock()
-        mock_response.content = csv_content.encode()
+        mock_response.iter_content.return_value = [csv_content.encode()]
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -92,6 +138,139 @@ class TestContentExtractor:
 
         assert "Platinum Card" in extracted_content
         assert "95" in extracted_content
+        # Cells are passed through as text, without column alignment padding
+        assert extracted_content == csv_content + "\n"
+
+    @patch("banks.services.content_extractor.requests.Session.get")
+    def test_extract_binary_content_stores_placeholder(self, mock_get):
+        """Test binary sources are not decoded into the raw content string."""
+        mock_response = Mock()
+        mock_response.iter_content.return_value = [b"\x89PNG\r\n\x1a\n\x00\x00binary"]
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        with patch.object(self.extractor, "_extract_image_content", return_value="text"):
+            raw_content, extracted_content = self.extractor.extract_content(
+                "http://example.com/cards.png", ContentType.IMAGE
+            )
+
+        assert raw_content == "<BINARY_CONTENT_IMAGE_SIZE_16>"
+        assert extracted_content == "text"
+
+    @patch("banks.services.content_extractor.tesserocr", None)
+    @patch("banks.services.content_extractor.pytesseract", None)
+    def test_extract_image_content_without_pytesseract(self):
+        """Test image OCR degrades to empty text when no OCR engine is installed."""
+        assert self.extractor._extract_image_content(b"\x89PNG\r\n") == ""
+
+    @patch("banks.services.content_extractor.pytesseract")
+    @patch("banks.services.content_extractor.tesserocr")
+    def test_ocr_image_prefers_tesserocr(self, mock_tesserocr, mock_pytesseract):
+        """Test in-process tesserocr is used instead of the pytesseract binary."""
+        import threading
+
+        from PIL import Image
+
+        api = mock_tesserocr.PyTessBaseAPI.return_value
+        api.GetUTF8Text.return_value = "Annual Fee: 500"
+        image = Image.new("L", (10, 10))
+
+        # Fresh per-thread engine cache so the mock engine does not leak
+        with patch("banks.services.content_extractor._tesserocr_apis", threading.local()):
+            text = self.extractor._ocr_image(image, psm=6)
+
+        assert text == "Annual Fee: 500"
+        mock_tesserocr.PyTessBaseAPI.assert_called_once_with(psm=6)
+        api.SetImage.assert_called_once_with(image)
+        mock_pytesseract.image_to_string.assert_not_called()
+
+    @pytest.mark.parametrize("pipeline_depth", [1, 4])
+    @patch("banks.services.content_extractor.pytesseract")
+    def test_extract_pdf_with_ocr_preserves_page_order(
+        self, mock_pytesseract, pipeline_depth
+    ):
+        """Test pages OCR'd on the shared pool are joined in page order."""
+        import fitz
+
+        doc = fitz.open()
+        for width in (100, 200, 300):
+            doc.new_page(width=width, height=100)
+        pdf_bytes = doc.tobytes()
+        doc.close()
+        mock_pytesseract.image_to_string.side_effect = (
+            lambda image, config: f"{image.mode} width {image.width}"
+        )
+
+        with (
+            patch("banks.services.content_extractor.OCR_PIPELINE_DEPTH", pipeline_depth),
+            patch("banks.services.content_extractor.OCR_MIN_PAGE_CHARS", 0),
+        ):
+            text = self.extractor._extract_pdf_with_ocr(pdf_bytes)
+
+        assert text == "L width 150\nL width 300\nL width 450"
+        assert mock_pytesseract.image_to_string.call_count == 3
+
+    @patch("banks.services.content_extractor.pytesseract")
+    def test_extract_pdf_with_ocr_retries_sparse_pages(self, mock_pytesseract):
+        """Test pages with too little text are re-rendered at higher scale."""
+        import fitz
+
+        doc = fitz.open()
+        doc.new_page(width=100, height=100)
+        pdf_bytes = doc.tobytes()
+        doc.close()
+        mock_pytesseract.image_to_string.side_effect = lambda image, config: (
+            "Fee" if image.width == 150 else "Recovered text"
+        )
+
+        text = self.extractor._extract_pdf_with_ocr(pdf_bytes)
+
+        assert text == "Recovered text"
+        assert mock_pytesseract.image_to_string.call_count == 2
+
+    @patch("banks.services.content_extractor.pytesseract")
+    def test_extract_pdf_with_ocr_does_not_retry_blank_pages(self, mock_pytesseract):
+        """Test a blank page without images is OCR'd only once."""
+        import fitz
+
+        doc = fitz.open()
+        doc.new_page(width=100, height=100)
+        pdf_bytes = doc.tobytes()
+        doc.close()
+        mock_pytesseract.image_to_string.return_value = ""
+
+        text = self.extractor._extract_pdf_with_ocr(pdf_bytes)
+
+        assert text == ""
+        assert mock_pytesseract.image_to_string.call_count == 1
+
+    @patch("banks.services.content_extractor.pytesseract")
+    def test_extract_pdf_content_ocrs_only_textless_pages(self, mock_pytesseract):
+        """Test OCR runs only on pages that lack a text layer."""
+        import fitz
+
+        doc = fitz.open()
+        text_page = doc.new_page(width=400, height=100)
+        text_page.insert_text((10, 50), "Annual fee schedule for Gold Card")
+        doc.new_page(width=200, height=100)
+        pdf_bytes = doc.tobytes()
+        doc.close()
+        mock_pytesseract.image_to_string.side_effect = (
+            lambda image, config: f"OCR width {image.width}"
+        )
+
+        with patch(
+            "banks.services.content_extractor.fitz.open", wraps=fitz.open
+        ) as mock_open:
+            text = self.extractor._extract_pdf_content(pdf_bytes)
+
+        # Text extraction and OCR share a single parse of the document
+        mock_open.assert_called_once()
+        assert text == "Annual fee schedule for Gold Card\nOCR width 300"
+        widths = [
+            call.args[0].width for call in mock_pytesseract.image_to_string.call_args_list
+        ]
+        assert widths == [300, 400]
 
     @patch("banks.services.content_extractor.requests.Session.get")
     def test_extract_content_failure(self, mock_get):
@@ -112,11 +291,45 @@ class TestContentExtractor:
     )
     def test_detect_content_type(self, mime_type, expected_type):
         """Test content type detection."""
-        with patch("banks.services.content_extractor.magic.from_buffer") as mock_magic:
-            mock_magic.return_value = mime_type
+        with patch("banks.services.content_extractor.get_mime_detector") as mock_magic:
+            mock_magic.return_value.from_buffer.return_value = mime_type
             content_type = self.extractor._detect_content_type(b"test content")
             assert content_type == expected_type
 
+    def test_extractors_share_http_session(self):
+        """Test extractor instances reuse one pooled, retrying session."""
+        other = ContentExtractor()
+
+        assert other.session is self.extractor.session
+        adapter = self.extractor.session.get_adapter("https://example.com")
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
+
+    @pytest.mark.parametrize(
+        "raw_content,expected_type",
+        [
+            (b"%PDF-1.7\n%\xe2\xe3", ContentType.PDF),
+            (b"\x89PNG\r\n\x1a\n", ContentType.IMAGE),
+            (b"\xff\xd8\xff\xe0\x00\x10JFIF", ContentType.IMAGE),
+            (b"  \n<!DOCTYPE html><html>", ContentType.WEBPAGE),
+            (b"<HTML><body>", ContentType.WEBPAGE),
+        ],
+    )
+    def test_detect_content_type_from_signature(self, raw_content, expected_type):
+        """Test well-known signatures are classified without libmagic."""
+        with patch("banks.services.content_extractor.get_mime_detector") as mock_magic:
+            content_type = self.extractor._detect_content_type(raw_content)
+
+        assert content_type == expected_type
+        mock_magic.assert_not_called()
+
+    def test_detect_content_type_reuses_mime_detector(self):
+        """Test the libmagic detector is created once per thread."""
+        from banks.services.content_extractor import get_mime_detector
+
+        assert get_mime_detector() is get_mime_detector()
+        assert self.extractor._detect_content_type(b"%PDF-1.4\n") == ContentType.PDF
+
 
 @pytest.mark.django_db
 class TestLLMContentParser:
@@ -196,6 +409,382 @@ class TestLLMContentParser:
             with pytest.raises(Exception):  # Should raise AIParsingError
                 self.parser.parse_credit_card_data(content, "Test Bank")
 
+    def test_build_parsing_prompt_keeps_static_prefix(self):
+        """Test per-call values only appear after the shared instruction prefix."""
+        first = self.parser._build_parsing_prompt("content one", "Bank A")
+        second = self.parser._build_parsing_prompt("content two", "Bank B")
+
+        assert first.startswith(CREDIT_CARD_PARSING_INSTRUCTIONS)
+        assert second.startswith(CREDIT_CARD_PARSING_INSTRUCTIONS)
+        assert first.endswith("==BANK==\nBank A\n==CONTENT==\ncontent one")
+
+    def test_build_comprehensive_parsing_prompt_keeps_static_prefix(self):
+        """Test the comprehensive prompt appends bank and content to the preamble."""
+        prompt = self.parser._build_comprehensive_parsing_prompt("fees", "Bank A")
+
+        assert prompt == (
+            f"{COMPREHENSIVE_PARSING_INSTRUCTIONS}\n\n==BANK==\nBank A\n==CONTENT==\nfees"
+        )
+
+    @pytest.mark.parametrize(
+        "raw_response",
+        [
+            '[{"name": "Gold Card"}]',
+            '\n  [{"name": "Gold Card"}]  \n',
+            '```json\n[{"name": "Gold Card"}]\n```',
+            '  ```JSON [{"name": "Gold Card"}] ```  ',
+            'Here are the cards:\n```json\n[{"name": "Gold Card"}]\n```',
+        ],
+    )
+    def test_clean_and_parse_response_unwraps_fences(self, raw_response):
+        """Test fenced and prefixed JSON responses parse to the same data."""
+        assert self.parser._clean_and_parse_response(raw_response) == [
+            {"name": "Gold Card"}
+        ]
+
+    def test_clean_and_parse_response_without_json(self):
+        """Test responses without any JSON value are rejected."""
+        with pytest.raises(AIParsingError, match="No valid JSON"):
+            self.parser._clean_and_parse_response("No cards were found.")
+
+    def test_build_parsing_prompt_minifies_content(self):
+        """Test layout whitespace is collapsed while cell lines stay in place."""
+        content = "  Annual Fee\t\t  BDT  500 \n\n\n  Free\n   Free  \n"
+
+        prompt = self.parser._build_parsing_prompt(content, "Bank A")
+
+        assert prompt.endswith("==CONTENT==\nAnnual Fee BDT 500\nFree\nFree")
+
+    def test_fit_content_to_token_budget_keeps_short_content(self):
+        """Test content within the budget is returned unchanged."""
+        content = "Annual fee: TK. 5,000\nInterest: 20%"
+
+        assert self.parser._fit_content_to_token_budget(content, 12) == content
+
+    def test_fit_content_to_token_budget_cuts_at_line_break(self):
+        """Test oversized content is cut by estimated tokens at a line boundary."""
+        content = "Gold Card fee 1,000\nSilver Card fee 500\nClassic Card fee 0"
+
+        trimmed = self.parser._fit_content_to_token_budget(content, 8)
+
+        assert trimmed == "Gold Card fee 1,000"
+
+    def test_build_parsing_prompt_applies_token_budget(self, settings):
+        """Test the parsing prompt embeds content cut to the configured budget."""
+        settings.LLM_MAX_CONTENT_TOKENS = 4
+        prompt = self.parser._build_parsing_prompt(
+            "alpha beta gamma\ndelta epsilon", "Bank A"
+        )
+
+        assert prompt.endswith("==CONTENT==\nalpha beta gamma")
+
+    def test_split_content_cuts_chunks_at_line_breaks(self, caplog):
+        """Test content is split into budget-sized chunks up to the chunk limit."""
+        content = "Gold Card fee 1,000\nSilver Card fee 500\nClassic Card fee 0"
+
+        assert self.parser._split_content(content, 8, 4) == [
+            "Gold Card fee 1,000",
+            "Silver Card fee 500\nClassic Card fee 0",
+        ]
+        assert self.parser._split_content(content, 8, 1) == ["Gold Card fee 1,000"]
+        assert "dropped the last 38 characters" in caplog.text
+
+    def test_parse_credit_card_data_merges_chunked_content(self, settings):
+        """Test oversized content is parsed per chunk and cards merged by name."""
+        settings.LLM_MAX_CONTENT_TOKENS = 8
+        responses = {
+            "Gold Card fee 1,000": [
+                {"name": "Gold Card", "annual_fee": 1000, "late_payment_fee": ""}
+            ],
+            "Silver Card fee 500\nClassic Card fee 0": [
+                {"name": "Gold Card", "annual_fee": 5, "late_payment_fee": "BDT 500"},
+                {"name": "Classic Card", "annual_fee": 0},
+            ],
+        }
+
+        def generate(prompt, **kwargs):
+            chunk = prompt.split("==CONTENT==\n", 1)[1]
+            return {"response": json.dumps(responses[chunk]), "provider": "gemini"}
+
+        with (
+            patch.object(
+                self.parser.orchestrator, "is_any_provider_available", return_value=True
+            ),
+            patch.object(
+                self.parser.orchestrator, "generate_response", side_effect=generate
+            ) as mock_generate,
+        ):
+            result = self.parser.parse_credit_card_data(
+                "Gold Card fee 1,000\nSilver Card fee 500\nClassic Card fee 0", "Bank A"
+            )
+
+        assert mock_generate.call_count == 2
+        cards = {card["name"]: card for card in result["credit_cards"]}
+        assert list(cards) == ["Gold Card", "Classic Card"]
+        assert cards["Gold Card"]["annual_fee"] == 1000
+        assert cards["Gold Card"]["late_payment_fee"] == "BDT 500"
+
+    def test_parse_comprehensive_data_merges_chunked_content(self, settings):
+        """Test oversized content is parsed comprehensively per chunk and merged."""
+        settings.LLM_MAX_CONTENT_TOKENS = 8
+        responses = {
+            "Gold Card fee 1,000": [{"name": "Gold Card", "CIB Fee": ""}],
+            "Silver Card fee 500\nClassic Card fee 0": [
+                {"name": "Gold Card", "CIB Fee": "BDT 100"},
+                {"name": "Classic Card", "annual_fee": 0},
+            ],
+        }
+
+        def generate(prompt, **kwargs):
+            assert prompt.startswith(COMPREHENSIVE_PARSING_INSTRUCTIONS)
+            chunk = prompt.split("==CONTENT==\n", 1)[1]
+            return {"response": json.dumps(responses[chunk]), "provider": "gemini"}
+
+        with (
+            patch.object(
+                self.parser.orchestrator, "is_any_provider_available", return_value=True
+            ),
+            patch.object(
+                self.parser.orchestrator, "generate_response", side_effect=generate
+            ) as mock_generate,
+        ):
+            parsed_data, metadata = self.parser.parse_comprehensive_data(
+                "Gold Card fee 1,000\nSilver Card fee 500\nClassic Card fee 0", "Bank A"
+            )
+
+        assert mock_generate.call_count == 2
+        assert parsed_data == [
+            {"name": "Gold Card", "CIB Fee": "BDT 100"},
+            {"name": "Classic Card", "annual_fee": 0},
+        ]
+        assert metadata == {"provider_used": "gemini"}
+
+    def test_validate_card_data_rejects_unusable_entries_early(self):
+        """Test non-dict and nameless entries are rejected before validation."""
+        parsed_data = ["Gold Card", {"annual_fee": 100}, {"name": "Classic Card"}]
+
+        with patch.object(
+            self.parser.validator,
+            "sanitize_credit_card_data",
+            wraps=self.parser.validator.sanitize_credit_card_data,
+        ) as mock_sanitize:
+            validated, errors = self.parser._validate_card_data(parsed_data)
+
+        mock_sanitize.assert_called_once_with({"name": "Classic Card"})
+        assert [card["name"] for card in validated] == ["Classic Card"]
+        assert errors == [
+            "Card 1: Invalid card data format",
+            "Card 2: Credit card name is required",
+        ]
+
+    def test_parse_skips_llm_for_blank_content(self):
+        """Test empty or whitespace-only content never reaches the LLM."""
+        with patch.object(self.parser.orchestrator, "generate_response") as mock_generate:
+            result = self.parser.parse_credit_card_data(" \n\t ", "Bank A")
+            comprehensive = self.parser.parse_comprehensive_data("", "Bank A")
+
+        mock_generate.assert_not_called()
+        assert result["credit_cards"] == []
+        assert result["provider_used"] is None
+        assert comprehensive == ([], {"provider_used": None})
+
+    def test_concurrent_identical_parses_share_one_llm_call(self):
+        """Test a parse arriving while an identical one is in flight waits for it."""
+        started = threading.Event()
+        release = threading.Event()
+        response = json.dumps([{"name": "Gold Card", "annual_fee": 1000}])
+
+        def generate(**kwargs):
+            started.set()
+            release.wait(timeout=5)
+            return {"response": response, "provider": "gemini"}
+
+        def log_info(message):
+            # Let the first parse finish only once the second one is waiting on it
+            if message.startswith("Waiting for an identical parse"):
+                release.set()
+
+        with (
+            patch.object(
+                self.parser.orchestrator, "is_any_provider_available", return_value=True
+            ),
+            patch.object(
+                self.parser.orchestrator, "generate_response", side_effect=generate
+            ) as mock_generate,
+            patch("banks.services.llm_parser.logger.info", side_effect=log_info),
+            ThreadPoolExecutor(max_workers=2) as executor,
+        ):
+            first = executor.submit(
+                self.parser.parse_credit_card_data, "same content", "Bank A"
+            )
+            started.wait(timeout=5)
+            second = executor.submit(
+                LLMContentParser().parse_credit_card_data, "same content", "Bank A"
+            )
+            results = [first.result(timeout=10), second.result(timeout=10)]
+
+        assert mock_generate.call_count == 1
+        assert results[0] == results[1]
+        assert results[0]["credit_cards"] is not results[1]["credit_cards"]
+
+    def test_coalesced_parse_rechecks_cache(self):
+        """Test a result cached after the caller's lookup is reused, not re-parsed."""
+        cache.set("llm:test:coalesced", {"credit_cards": [{"name": "Gold Card"}]})
+        parse = Mock()
+
+        result = self.parser._run_coalesced("llm:test:coalesced", parse)
+
+        parse.assert_not_called()
+        assert result == {"credit_cards": [{"name": "Gold Card"}]}
+
+    def test_parse_credit_card_data_reuses_cached_result(self):
+        """Test unchanged content for the same bank skips the LLM call."""
+        response = json.dumps([{"name": "Gold Card", "annual_fee": 1000}])
+
+        with (
+            patch.object(
+                self.parser.orchestrator, "is_any_provider_available", return_value=True
+            ),
+            patch.object(
+                self.parser.orchestrator,
+                "generate_response",
+                return_value={"response": response, "provider": "gemini"},
+            ) as mock_generate,
+        ):
+            first = self.parser.parse_credit_card_data("same content", "Bank A")
+            second = self.parser.parse_credit_card_data("same content", "Bank A")
+            self.parser.parse_credit_card_data("same content", "Bank B")
+
+        assert second == first
+        assert mock_generate.call_count == 2
+
+    def test_cache_key_changes_with_prompt_version(self):
+        """Test bumping the prompt version invalidates cached parses."""
+        key = self.parser._build_cache_key("same content", "Bank A")
+
+        with patch("banks.services.llm_parser.PROMPT_VERSION", PROMPT_VERSION + 1):
+            bumped = self.parser._build_cache_key("same content", "Bank A")
+
+        assert key.startswith(f"llm:cc:v{PROMPT_VERSION}:")
+        assert bumped != key
+
+    def test_cache_key_ignores_layout_whitespace(self):
+        """Test contents that minify to the same prompt share a cache key."""
+        key = self.parser._build_cache_key("Gold Card\nFee: 1,000", "Bank A")
+
+        assert (
+            self.parser._build_cache_key("  Gold   Card\n\n\nFee:\t1,000 \n", "Bank A")
+            == key
+        )
+        assert self.parser._build_cache_key("Gold Card\nFee: 1.000", "Bank A") != key
+
+    def test_parse_credit_card_data_skips_caching_mostly_invalid_result(self):
+        """Test a parse dominated by rejected cards is not cached."""
+        response = json.dumps(
+            [{"name": "Gold Card", "annual_fee": 1000}, {"annual_fee": 5}, "Classic"]
+        )
+
+        with (
+            patch.object(
+                self.parser.orchestrator, "is_any_provider_available", return_value=True
+            ),
+            patch.object(
+                self.parser.orchestrator,
+                "generate_response",
+                return_value={"response": response, "provider": "gemini"},
+            ) as mock_generate,
+        ):
+            first = self.parser.parse_credit_card_data("same content", "Bank A")
+            self.parser.parse_credit_card_data("same content", "Bank A")
+
+        assert len(first["credit_cards"]) == 1
+        assert len(first["validation_errors"]) == 2
+        assert mock_generate.call_count == 2
+
+    def test_parse_comprehensive_data_reuses_cached_result(self):
+        """Test comprehensive parsing is cached separately from structured parsing."""
+        response = json.dumps([{"name": "Gold Card", "CIB Fee": "BDT 100"}])
+
+        with (
+            patch.object(
+                self.parser.orchestrator, "is_any_provider_available", return_value=True
+            ),
+            patch.object(
+                self.parser.orchestrator,
+                "generate_response",
+                return_value={"response": response, "provider": "gemini"},
+            ) as mock_generate,
+        ):
+            first = self.parser.parse_comprehensive_data("same content", "Bank A")
+            second = self.parser.parse_comprehensive_data("same content", "Bank A")
+            self.parser.parse_credit_card_data("same content", "Bank A")
+
+        assert second == first
+        assert first[1] == {"provider_used": "gemini"}
+        assert mock_generate.call_count == 2
+
+    @pytest.mark.parametrize(
+        "records",
+        [
+            [{"CIB Fee": "BDT 100"}],
+            [{"name": "Gold Card"}, {"name": ""}, "Classic Card"],
+            {"name": "Gold Card"},
+        ],
+    )
+    def test_parse_comprehensive_data_skips_caching_unusable_result(self, records):
+        """Test a comprehensive parse without enough named records is not cached."""
+        with (
+            patch.object(
+                self.parser.orchestrator, "is_any_provider_available", return_value=True
+            ),
+            patch.object(
+                self.parser.orchestrator,
+                "generate_response",
+                return_value={"response": json.dumps(records), "provider": "gemini"},
+            ) as mock_generate,
+        ):
+            self.parser.parse_comprehensive_data("same content", "Bank A")
+            self.parser.parse_comprehensive_data("same content", "Bank A")
+
+        assert mock_generate.call_count == 2
+
+    def test_llm_connectivity_probes_providers_concurrently(self):
+        """Test every provider is probed at the same time and reported by name."""
+        both_started = threading.Barrier(2, timeout=5)
+
+        def fake_generate(prompt, preferred_provider, max_retries):
+            both_started.wait()
+            if preferred_provider == "openrouter":
+                raise Exception("unreachable")
+            return {"response": "OK", "provider": preferred_provider}
+
+        with (
+            patch.object(
+                self.parser.orchestrator,
+                "providers",
+                {"gemini": Mock(), "openrouter": Mock()},
+            ),
+            patch.object(
+                self.parser.orchestrator, "generate_response", side_effect=fake_generate
+            ),
+        ):
+            results = self.parser.test_llm_connectivity()
+
+        assert results == {
+            "gemini": {"status": "success", "response": "OK"},
+            "openrouter": {"status": "failed", "error": "unreachable"},
+        }
+
+    def test_estimate_response_tokens_scales_with_content(self):
+        """Test output budgets grow with content between the floor and ceiling."""
+        short = "Gold Card fee 1,000"
+        medium = " ".join(["fee"] * 1000)
+        long = " ".join(["fee"] * 5000)
+
+        assert self.parser._estimate_response_tokens(short, 4000) == MIN_RESPONSE_TOKENS
+        assert self.parser._estimate_response_tokens(medium, 4000) == 3000
+        assert self.parser._estimate_response_tokens(long, 4000) == 4000
+
 
 @pytest.mark.django_db
 class TestCreditCardDataService:
@@ -247,6 +836,188 @@ class TestCreditCardDataService:
         card.refresh_from_db()
         assert float(card.annual_fee) == 95.0
 
+    def test_update_credit_card_data_upserts_in_bulk(self):
+        """Test new and existing cards are written with one bulk upsert."""
+        card = CreditCardFactory(bank=self.bank, name="Gold Card", annual_fee=50)
+        parsed_data = [
+            {"name": "Gold Card", "annual_fee": 75, "interest_rate_apr": 20},
+            {"name": "Silver Card", "annual_fee": 25, "interest_rate_apr": 22},
+        ]
+
+        with patch.object(
+            CreditCard.objects, "bulk_create", wraps=CreditCard.objects.bulk_create
+        ) as mock_bulk_create:
+            updated_count = self.service.update_credit_card_data(
+                self.bank.id, parsed_data
+            )
+
+        assert updated_count == 2
+        mock_bulk_create.assert_called_once()
+        assert mock_bulk_create.call_args.kwargs["batch_size"] == 500
+        card.refresh_from_db()
+        assert float(card.annual_fee) == 75.0
+        assert CreditCard.objects.filter(bank=self.bank).count() == 2
+
+    def test_update_credit_card_data_without_conflict_target_support(self):
+        """Test backends without ON CONFLICT targets use bulk create/update."""
+        from django.db import connection
+
+        card = CreditCardFactory(bank=self.bank, name="Gold Card", annual_fee=50)
+        parsed_data = [
+            {"name": "Gold Card", "annual_fee": 75, "interest_rate_apr": 20},
+            {"name": "Silver Card", "annual_fee": 25, "interest_rate_apr": 22},
+        ]
+
+        with patch.object(
+            connection.features, "supports_update_conflicts_with_target", False
+        ):
+            updated_count = self.service.update_credit_card_data(
+                self.bank.id, parsed_data
+            )
+
+        assert updated_count == 2
+        card.refresh_from_db()
+        assert float(card.annual_fee) == 75.0
+        assert CreditCard.objects.filter(bank=self.bank, name="Silver Card").exists()
+
+    def test_update_credit_card_data_falls_back_per_card(self):
+        """Test cards are saved one by one when the bulk upsert fails."""
+        parsed_data = [{"name": "Gold Card", "annual_fee": 75, "interest_rate_apr": 20}]
+
+        with patch.object(
+            CreditCard.objects, "bulk_create", side_effect=Exception("DB error")
+        ):
+            updated_count = self.service.update_credit_card_data(
+                self.bank.id, parsed_data
+            )
+
+        assert updated_count == 1
+        assert CreditCard.objects.filter(bank=self.bank, name="Gold Card").exists()
+
+    def test_update_credit_card_data_fallback_updates_without_row_fetch(
+        self, django_assert_num_queries
+    ):
+        """Test the per-card fallback looks up names once, then writes each card."""
+        card = CreditCardFactory(bank=self.bank, name="Gold Card", annual_fee=50)
+        parsed_data = [
+            {"name": "Gold Card", "annual_fee": 75},
+            {"name": "Silver Card", "annual_fee": 25},
+        ]
+
+        # Lookup, UPDATE and INSERT, plus savepoint/release pairs for the batch
+        # (nested in the test transaction) and for each card
+        with django_assert_num_queries(9):
+            updated_count = self.service._update_cards_individually(
+                self.bank.id, parsed_data
+            )
+
+        assert updated_count == 2
+        card.refresh_from_db()
+        assert float(card.annual_fee) == 75.0
+        assert CreditCard.objects.filter(bank=self.bank, name="Silver Card").exists()
+
+    def test_update_cards_individually_logs_one_summary(self, caplog):
+        """Test the per-card fallback logs created and updated totals once."""
+        CreditCardFactory(bank=self.bank, name="Gold Card")
+        parsed_data = [{"name": "Gold Card"}, {"name": "Silver Card"}]
+
+        with caplog.at_level("DEBUG", logger="banks.services.credit_card_data_service"):
+            self.service._update_cards_individually(self.bank.id, parsed_data)
+
+        assert (
+            f"Saved cards one by one for bank {self.bank.id}: 1 created, 1 updated"
+            in caplog.messages
+        )
+        assert not any("credit card: " in message for message in caplog.messages)
+
+    def test_update_cards_individually_isolates_failing_card(self):
+        """Test one failing card in the fallback does not roll back the others."""
+        parsed_data = [
+            {"name": "Gold Card", "annual_fee": 75},
+            {"name": "Broken Card", "annual_fee": 10},
+            {"name": "Silver Card", "annual_fee": 25},
+        ]
+        original_create = CreditCard.objects.create
+
+        def create(**kwargs):
+            if kwargs["name"] == "Broken Card":
+                original_create(**{**kwargs, "name": "Gold Card"})
+            return original_create(**kwargs)
+
+        with patch.object(CreditCard.objects, "create", side_effect=create):
+            updated_count = self.service._update_cards_individually(
+                self.bank.id, parsed_data
+            )
+
+        assert updated_count == 2
+        assert set(
+            CreditCard.objects.filter(bank=self.bank).values_list("name", flat=True)
+        ) == {"Gold Card", "Silver Card"}
+
+    def test_lock_bank_cards_takes_advisory_lock_on_postgres(self):
+        """Test card writes take a per-bank transaction advisory lock on PostgreSQL."""
+        with patch(
+            "banks.services.credit_card_data_service.connection"
+        ) as mock_connection:
+            mock_connection.vendor = "postgresql"
+            cursor = mock_connection.cursor.return_value.__enter__.return_value
+
+            self.service._lock_bank_cards(self.bank.id)
+
+        cursor.execute.assert_called_once_with(
+            "SELECT pg_advisory_xact_lock(%s, %s)",
+            [CARD_WRITE_LOCK_NAMESPACE, self.bank.id],
+        )
+
+    def test_card_update_fields_match_prepared_defaults(self):
+        """Test the upsert column list stays in sync with the prepared defaults."""
+        defaults = self.service._prepare_card_defaults({"name": "Gold Card"})
+
+        assert CARD_UPDATE_FIELDS == (*defaults, "modified")
+
+    @pytest.mark.parametrize(
+        "parsed_data,expected",
+        [
+            ([{"name": "Gold"}], [{"name": "Gold"}]),
+            ({"credit_cards": [{"name": "Gold"}]}, [{"name": "Gold"}]),
+            ({"data": {"credit_cards": [{"name": "Gold"}]}}, [{"name": "Gold"}]),
+            ({"credit_cards": None}, []),
+            ({"other": 1}, []),
+            ("not cards", []),
+        ],
+    )
+    def test_normalize_parsed_data(self, parsed_data, expected):
+        """Test every supported payload shape normalizes to a list of cards."""
+        assert self.service._normalize_parsed_data(parsed_data) == expected
+
+    def test_update_credit_card_data_logs_only_summary_at_info(self, caplog):
+        """Test per-card payloads are not logged at INFO level."""
+        parsed_data = [{"name": "Gold Card", "annual_fee": 75, "secret": "payload"}]
+
+        with caplog.at_level("INFO", logger="banks.services.credit_card_data_service"):
+            self.service.update_credit_card_data(self.bank.id, parsed_data)
+
+        assert "payload" not in caplog.text
+        assert f"Processed 1 credit cards for bank {self.bank.id}" in caplog.text
+
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("Platinum Card", "Platinum Card"),
+            ("  Gold Card ", "Gold Card"),
+            ("TK. 5,000", "Credit Card (Annual Fee: 500)"),
+            ("US$ 50", "Credit Card (Annual Fee: 500)"),
+            ("2,500.00", "Credit Card (Annual Fee: 500)"),
+            ("", "Credit Card (Annual Fee: 500)"),
+            ("Visa 2025", "Visa 2025"),
+        ],
+    )
+    def test_resolve_card_name(self, name, expected):
+        """Test fee-like or missing card names are replaced with a fallback."""
+        card_data = {"name": name, "annual_fee": 500}
+
+        assert self.service._resolve_card_name(card_data) == expected
+
     def test_update_credit_card_data_invalid_format(self):
         """Test handling of invalid data format."""
         parsed_data = {"invalid": "format"}
@@ -262,6 +1033,7 @@ class TestCreditCardDataService:
             (18.99, 18.99),
             ("$95.00", 95.0),
             ("18.99%", 18.99),
+            (" 5,000 ", 5000.0),
             ("invalid", 0.0),
         ],
     )
@@ -269,6 +1041,16 @@ class TestCreditCardDataService:
         """Test decimal value parsing."""
         assert self.service._parse_decimal(value) == expected
 
+    def test_parse_decimal_memoizes_strings(self):
+        """Test repeated fee strings are served from the parse cache."""
+        from banks.services.credit_card_data_service import _parse_decimal_string
+
+        self.service._parse_decimal("$2,500")
+        hits = _parse_decimal_string.cache_info().hits
+
+        assert self.service._parse_decimal("$2,500") == 2500.0
+        assert _parse_decimal_string.cache_info().hits == hits + 1
+
 
 @pytest.mark.django_db
 class TestBankDataCrawlerService:
@@ -425,6 +1207,25 @@ class TestBankDataCrawlerService:
             self.data_source.refresh_from_db()
             assert self.data_source.failed_attempt_count == 0
 
+    @patch("banks.services.bank_data_crawler.connection")
+    def test_crawl_all_active_sources_threaded(self, mock_connection, settings):
+        """Test each worker closes its connection and a raising worker is counted."""
+        settings.CRAWLER_MAX_WORKERS = 4
+        failing_source = BankDataSourceFactory(bank=self.bank)
+        BankDataSourceFactory(bank=self.bank)
+
+        def crawl(data_source_id):
+            if data_source_id == failing_source.id:
+                raise RuntimeError("worker crashed")
+            return True
+
+        with patch.object(self.service, "crawl_bank_data_source", side_effect=crawl):
+            results = self.service.crawl_all_active_sources()
+
+        total = BankDataSource.objects.filter(is_active=True).count()
+        assert results == {"total": total, "successful": total - 1, "failed": 1}
+        assert mock_connection.close.call_count == total
+
     @patch("banks.models.BankDataSource.objects.filter")
     def test_crawl_all_active_sources(self, mock_filter):
         """Test crawling all active sources."""
@@ -2,17 +2,20 @@
 Comprehensive tests for banks services with all new features.
 """
 
-import hashlib
 import json
+from datetime import timedelta
 from unittest.mock import Mock, patch
 
 import pytest
 
+from django.utils import timezone
+
 from banks.enums import ContentType
 from banks.exceptions import (
     AIParsingError,
     ConfigurationError,
     ContentExtractionError,
+    ContentNotModifiedError,
     FileFormatError,
     NetworkError,
 )
@@ -38,7 +41,7 @@ class TestContentExtractorUpdated:
     def test_extract_content_success(self, mock_get):
         """Test successful content extraction."""
         mock_response = Mock()
-        mock_response.content = b"Test PDF content"
+        mock_response.iter_content.return_value = [b"Test PDF content"]
         mock_response.text = "Test HTML content"
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
@@ -119,7 +122,7 @@ class TestContentExtractorUpdated:
     def test_extract_content_unknown_type_error(self, mock_get):
         """Test handling of unknown content types."""
         mock_response = Mock()
-        mock_response.content = b"Unknown content"
+        mock_response.iter_content.return_value = [b"Unknown content"]
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -129,6 +132,72 @@ class TestContentExtractorUpdated:
 
             assert "Unable to detect content type" in str(exc_info.value)
 
+    @patch("banks.services.content_extractor.requests.Session.get")
+    def test_extract_content_auto_detected_type(self, mock_get):
+        """Test unknown content types are dispatched by their detected type."""
+        mock_response = Mock()
+        mock_response.iter_content.return_value = [b"Card Name,Annual Fee\nGold Card,500"]
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        with patch.object(
+            self.extractor, "_detect_content_type", return_value=ContentType.CSV
+        ):
+            _, extracted_content = self.extractor.extract_content(
+                "http://example.com/unknown", "UNKNOWN"
+            )
+
+        assert "Gold Card" in extracted_content
+
+    @patch("banks.services.content_extractor.requests.Session.get")
+    def test_extract_content_not_modified(self, mock_get):
+        """Test conditional fetch raises when the server answers 304."""
+        mock_response = Mock()
+        mock_response.status_code = 304
+        mock_get.return_value = mock_response
+
+        cache_validators = {"etag": '"abc123"', "last_modified": ""}
+        with pytest.raises(ContentNotModifiedError):
+            self.extractor.extract_content(
+                "http://example.com/test.pdf",
+                ContentType.PDF,
+                cache_validators=cache_validators,
+            )
+
+        headers = mock_get.call_args.kwargs["headers"]
+        assert headers == {"If-None-Match": '"abc123"'}
+
+    @patch("banks.services.content_extractor.MAX_CONTENT_BYTES", 8)
+    @patch("banks.services.content_extractor.requests.Session.get")
+    def test_extract_content_too_large(self, mock_get):
+        """Test that oversized bodies are rejected while streaming."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.iter_content.return_value = [b"<html>", b"<body>", b"</html>"]
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        with pytest.raises(ContentExtractionError) as exc_info:
+            self.extractor.extract_content("https://example.com", ContentType.WEBPAGE)
+
+        assert "Content too large" in str(exc_info.value)
+        mock_response.close.assert_called_once()
+
+    @patch("banks.services.content_extractor.requests.Session.get")
+    def test_extract_content_declared_too_large(self, mock_get):
+        """Test oversized Content-Length is rejected before reading the body."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Length": str(200 * 1024 * 1024)}
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        with pytest.raises(ContentExtractionError) as exc_info:
+            self.extractor.extract_content("https://example.com", ContentType.WEBPAGE)
+
+        assert "Content too large" in str(exc_info.value)
+        mock_response.iter_content.assert_not_called()
+
 
 @pytest.mark.django_db
 class TestLLMContentParserUpdated:
@@ -381,13 +450,15 @@ class TestBankDataCrawlerServiceUpdated:
         """Test crawling when no changes are detected."""
         # Create existing crawled content with hash
         test_content = "Test extracted content"
-        content_hash = hashlib.sha256(test_content.encode("utf-8")).hexdigest()
+        content_hash = self.service._generate_content_hash(test_content)
 
         CrawledContentFactory(
             data_source=self.data_source,
             content_hash=content_hash,
             processing_status="completed",
         )
+        self.data_source.last_content_hash = content_hash
+        self.data_source.save(update_fields=["last_content_hash"])
 
         with patch.object(
             self.service.content_extractor, "extract_content"
@@ -410,6 +481,94 @@ class TestBankDataCrawlerServiceUpdated:
             # Content might be processed or skipped depending on implementation
             assert latest_crawl.parsed_json is not None
 
+    def test_crawl_bank_data_source_not_modified(self):
+        """Test a 304 response is recorded as an unchanged successful crawl."""
+        self.data_source.last_content_hash = "a" * 64
+        self.data_source.last_etag = '"abc123"'
+        self.data_source.save(update_fields=["last_content_hash", "last_etag"])
+
+        with (
+            patch.object(
+                self.service.content_extractor, "extract_content"
+            ) as mock_extract,
+            patch.object(
+                self.service.llm_parser, "parse_comprehensive_data"
+            ) as mock_parse,
+        ):
+            mock_extract.side_effect = ContentNotModifiedError("Content not modified")
+
+            result = self.service.crawl_bank_data_source(self.data_source.id)
+
+            assert result is True
+            mock_parse.assert_not_called()
+            assert mock_extract.call_args.kwargs["cache_validators"] == {
+                "etag": '"abc123"',
+                "last_modified": "",
+            }
+
+        self.data_source.refresh_from_db()
+        assert self.data_source.last_successful_crawl_at is not None
+        assert self.data_source.last_etag == '"abc123"'
+
+    def test_crawl_bank_data_source_whitespace_change_reuses_parse(self):
+        """Test whitespace-only changes reuse the previous parse instead of the LLM."""
+        previous_parse = [{"name": "Gold Card", "annual_fee": 500}]
+        CrawledContentFactory(
+            data_source=self.data_source,
+            content_hash=self.service._generate_content_hash("Gold Card fee 500"),
+            canonical_hash=self.service._generate_canonical_hash("Gold Card fee 500"),
+            parsed_json=previous_parse,
+            processing_status="completed",
+        )
+
+        with (
+            patch.object(
+                self.service.content_extractor, "extract_content"
+            ) as mock_extract,
+            patch.object(
+                self.service.llm_parser, "parse_comprehensive_data"
+            ) as mock_parse,
+            patch.object(
+                self.service.data_service, "update_credit_card_data"
+            ) as mock_update,
+        ):
+            mock_extract.return_value = ("raw content", "Gold Card\n  fee  500 ")
+            mock_update.return_value = 1
+
+            result = self.service.crawl_bank_data_source(self.data_source.id)
+
+            assert result is True
+            mock_parse.assert_not_called()
+            mock_update.assert_called_once_with(self.bank.id, previous_parse)
+
+    def test_crawl_bank_data_source_ignores_older_matching_parse(self):
+        """Test only the latest completed crawl is considered for parse reuse."""
+        older = CrawledContentFactory(
+            data_source=self.data_source,
+            content_hash=self.service._generate_content_hash("Gold Card fee 500"),
+            canonical_hash=self.service._generate_canonical_hash("Gold Card fee 500"),
+            parsed_json=[{"name": "Gold Card", "annual_fee": 500}],
+            processing_status="completed",
+        )
+        CrawledContent.objects.filter(pk=older.pk).update(
+            crawled_at=timezone.now() - timedelta(days=90)
+        )
+        CrawledContentFactory(
+            data_source=self.data_source,
+            content_hash=self.service._generate_content_hash("Gold Card fee 700"),
+            canonical_hash=self.service._generate_canonical_hash("Gold Card fee 700"),
+            parsed_json=[{"name": "Gold Card", "annual_fee": 700}],
+            processing_status="completed",
+        )
+
+        assert (
+            self.service._find_reusable_parse(
+                self.data_source,
+                self.service._generate_canonical_hash("Gold Card\n  fee  500 "),
+            )
+            is None
+        )
+
     def test_crawl_bank_data_source_content_extraction_error(self):
         """Test handling of content extraction errors."""
         with patch.object(
@@ -586,6 +745,7 @@ class TestBankDataCrawlerServiceUpdated:
             ).first()
             assert crawl_record.content_hash
             assert crawl_record.extracted_content == "new extracted content"
+            assert self.data_source.last_content_hash == crawl_record.content_hash
 
 
 @pytest.mark.django_db
@@ -701,3 +861,29 @@ class TestScheduleChargeURLFinderUpdated:
             assert result["found"] is True
             assert result["url"] == "http://example.com/charges.pdf"
             assert result["content_type"] == "PDF"
+
+    def test_parse_llm_response_extracts_url_from_text(self):
+        """Test a plain-text LLM answer yields the URL up to the next whitespace."""
+        result = self.finder._parse_llm_response(
+            "The schedule is at https://bank.example/docs/fees.pdf for all cards"
+        )
+
+        assert result["found"] is True
+        assert result["url"] == "https://bank.example/docs/fees.pdf"
+        assert result["content_type"] == "PDF"
+
+    def test_fallback_pattern_search_reports_matched_pattern(self):
+        """Test pattern matching returns the first link matching a charge pattern."""
+        links = [
+            {"text": "About us", "url": "https://bank.example/about"},
+            {"text": "Tariff", "url": "https://bank.example/tariff"},
+        ]
+
+        with patch.object(
+            self.finder, "_fetch_webpage_content", return_value={"links": links}
+        ):
+            result = self.finder._fallback_pattern_search("https://bank.example")
+
+        assert result["url"] == "https://bank.example/tariff"
+        assert result["pattern"] == "tariff"
+        assert result["method"] == "pattern_matching"
@@ -0,0 +1,21 @@
+import pytest
+
+from banks.utils import collapse_layout_whitespace, collapse_whitespace
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("Gold  Card\t\tfee", "Gold Card fee"),
+        ("  Row 1 \n\n\n  Row 2  ", "Row 1\nRow 2"),
+        ("\n \n", ""),
+    ],
+)
+def test_collapse_layout_whitespace(text, expected):
+    """Test spaces collapse while line breaks between rows are kept."""
+    assert collapse_layout_whitespace(text) == expected
+
+
+def test_collapse_whitespace_joins_lines():
+    """Test every whitespace run, line breaks included, becomes one space."""
+    assert collapse_whitespace(" Gold Card\n  fee  500 ") == "Gold Card fee 500"
@@ -0,0 +1,43 @@
+"""Text helpers shared by the banks services."""
+
+import re
+
+INLINE_WHITESPACE_RE = re.compile(r"[^\S\n]+")
+LINE_BREAK_RE = re.compile(r"\s*\n\s*")
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def collapse_layout_whitespace(text):
+    """Collapse layout whitespace while keeping line structure.
+
+    Parameters
+    ----------
+    text : str
+        Text to normalize
+
+    Returns
+    -------
+    str
+        Text with runs of spaces and tabs collapsed to one space and blank
+        lines and line-edge padding removed; line order is left untouched so
+        table cells keep their position
+    """
+    text = INLINE_WHITESPACE_RE.sub(" ", text)
+    return LINE_BREAK_RE.sub("\n", text).strip()
+
+
+def collapse_whitespace(text):
+    """Collapse every whitespace run, line breaks included, to one space.
+
+    Parameters
+    ----------
+    text : str
+        Text to normalize
+
+    Returns
+    -------
+    str
+        Single-line text that is identical for inputs differing only in
+        whitespace
+    """
+    return WHITESPACE_RE.sub(" ", text).strip()
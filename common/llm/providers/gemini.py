@@ -6,6 +6,7 @@ the Google Generative AI API.
 """
 
 import logging
+import threading
 
 import google.generativeai as genai
 
@@ -22,6 +23,34 @@ from common.llm.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+_gemini_models = {}
+_gemini_models_lock = threading.Lock()
+
+
+def get_gemini_model(api_key, model_name):
+    """Return the process-wide Gemini model client for an API key and model.
+
+    Parameters
+    ----------
+    api_key : str
+        Gemini API key the model is configured with
+    model_name : str
+        Name of the Gemini model
+
+    Returns
+    -------
+    google.generativeai.GenerativeModel
+        Model client shared by every provider instance in the process
+    """
+    cache_key = (api_key, model_name)
+    with _gemini_models_lock:
+        model = _gemini_models.get(cache_key)
+        if model is None:
+            genai.configure(api_key=api_key)
+            model = genai.GenerativeModel(model_name)
+            _gemini_models[cache_key] = model
+        return model
+
 
 class GeminiProvider(BaseLLMProvider):
     """Gemini LLM provider implementation.
@@ -53,8 +82,7 @@ class GeminiProvider(BaseLLMProvider):
                 self._is_configured = False
                 return False
 
-            genai.configure(api_key=api_key)
-            self.model = genai.GenerativeModel(self.default_model_name)
+            self.model = get_gemini_model(api_key, self.default_model_name)
             self._is_configured = True
             logger.info("Gemini provider configured successfully")
             return True
@@ -75,7 +103,14 @@ class GeminiProvider(BaseLLMProvider):
         return self._is_configured and self.model is not None
 
     def generate_response(
-        self, prompt, system_prompt=None, temperature=None, max_tokens=None, **kwargs
+        self,
+        prompt,
+        system_prompt=None,
+        temperature=None,
+        max_tokens=None,
+        json_mode=False,
+        response_schema=None,
+        **kwargs,
     ):
         """Generate response using Gemini API.
 
@@ -89,6 +124,11 @@ class GeminiProvider(BaseLLMProvider):
             Sampling temperature (Note: Gemini handles this differently)
         max_tokens : int, optional
             Maximum tokens in response (Note: Gemini uses different limits)
+        json_mode : bool
+            Request raw JSON output via the ``application/json`` response type
+        response_schema : dict, optional
+            OpenAPI-style schema the JSON output is constrained to; implies
+            ``json_mode``
         **kwargs : dict
             Additional Gemini API parameters
 
@@ -115,7 +155,7 @@ class GeminiProvider(BaseLLMProvider):
         try:
             full_prompt = self._build_full_prompt(prompt, system_prompt)
             generation_config = self._build_generation_config(
-                temperature, max_tokens, **kwargs
+                temperature, max_tokens, json_mode, response_schema, **kwargs
             )
             response = self._call_gemini_api(full_prompt, generation_config)
 
@@ -156,7 +196,9 @@ class GeminiProvider(BaseLLMProvider):
             return f"{system_prompt}\n\n{prompt}"
         return prompt
 
-    def _build_generation_config(self, temperature, max_tokens, **kwargs):
+    def _build_generation_config(
+        self, temperature, max_tokens, json_mode=False, response_schema=None, **kwargs
+    ):
         """Build generation configuration for Gemini API.
 
         Parameters
@@ -165,6 +207,10 @@ class GeminiProvider(BaseLLMProvider):
             Sampling temperature
         max_tokens : int, optional
             Maximum tokens
+        json_mode : bool
+            Whether to constrain the output to JSON
+        response_schema : dict, optional
+            Schema the JSON output must follow
         **kwargs : dict
             Additional parameters
 
@@ -178,6 +224,10 @@ class GeminiProvider(BaseLLMProvider):
             config["temperature"] = temperature
         if max_tokens is not None:
             config["max_output_tokens"] = max_tokens
+        if json_mode or response_schema is not None:
+            config["response_mime_type"] = "application/json"
+        if response_schema is not None:
+            config["response_schema"] = response_schema
         config.update(kwargs)
         return config
 
@@ -6,6 +6,7 @@ which acts as a unified gateway to multiple language models.
 """
 
 import logging
+import threading
 
 from openai import OpenAI
 
@@ -22,6 +23,34 @@ from common.llm.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+_openrouter_clients = {}
+_openrouter_clients_lock = threading.Lock()
+
+
+def get_openrouter_client(api_key, base_url):
+    """Return the process-wide OpenAI client for an API key and base URL.
+
+    Parameters
+    ----------
+    api_key : str
+        OpenRouter API key the client authenticates with
+    base_url : str
+        OpenRouter API base URL
+
+    Returns
+    -------
+    openai.OpenAI
+        Client shared by every provider instance, so its HTTP connection
+        pool is reused across orchestrators
+    """
+    cache_key = (api_key, base_url)
+    with _openrouter_clients_lock:
+        client = _openrouter_clients.get(cache_key)
+        if client is None:
+            client = OpenAI(base_url=base_url, api_key=api_key)
+            _openrouter_clients[cache_key] = client
+        return client
+
 
 class OpenRouterProvider(BaseLLMProvider):
     """OpenRouter LLM provider implementation.
@@ -53,10 +82,7 @@ class OpenRouterProvider(BaseLLMProvider):
                 self._is_configured = False
                 return False
 
-            self.client = OpenAI(
-                base_url=self.base_url,
-                api_key=api_key,
-            )
+            self.client = get_openrouter_client(api_key, self.base_url)
             self._is_configured = True
             logger.info("OpenRouter provider configured successfully")
             return True
@@ -83,6 +109,8 @@ class OpenRouterProvider(BaseLLMProvider):
         model=None,
         temperature=0.1,
         max_tokens=4000,
+        json_mode=False,
+        response_schema=None,
         **kwargs,
     ):
         """Generate response using OpenRouter API.
@@ -99,6 +127,13 @@ class OpenRouterProvider(BaseLLMProvider):
             Sampling temperature (0.0 to 1.0)
         max_tokens : int
             Maximum tokens in response
+        json_mode : bool
+            Accepted for parity with other providers but not forwarded:
+            ``response_format`` JSON mode only allows a top-level object,
+            while the parsing prompts ask for a JSON array
+        response_schema : dict, optional
+            Accepted for parity with other providers but not forwarded: the
+            default free model does not support ``json_schema`` responses
         **kwargs : dict
             Additional OpenAI API parameters
 
@@ -6,17 +6,114 @@ automatic fallback, retry logic, and comprehensive error handling.
 """
 
 import logging
+import random
+import threading
+import time
+
+from django.conf import settings
 
 from common.llm.exceptions import (
     AllLLMProvidersFailedError,
+    LLMAuthenticationError,
     LLMConfigurationError,
     LLMError,
-    LLMRateLimitError,
 )
 from common.llm.providers import GeminiProvider, OpenRouterProvider
 
 logger = logging.getLogger(__name__)
 
+# Exponential backoff bounds, in seconds, between retries of the same provider
+RETRY_BACKOFF_INITIAL = 0.5
+RETRY_BACKOFF_MAX = 8.0
+
+# Errors a retry cannot fix, so the orchestrator moves on to the next provider
+NON_RETRYABLE_ERRORS = (LLMAuthenticationError, LLMConfigurationError)
+
+_request_slots = None
+_request_slots_lock = threading.Lock()
+
+
+def get_request_slots():
+    """Return the process-wide semaphore bounding in-flight LLM requests.
+
+    Returns
+    -------
+    threading.BoundedSemaphore
+        Semaphore sized by the LLM_MAX_CONCURRENT_REQUESTS setting
+    """
+    global _request_slots
+    if _request_slots is None:
+        with _request_slots_lock:
+            if _request_slots is None:
+                _request_slots = threading.BoundedSemaphore(
+                    settings.LLM_MAX_CONCURRENT_REQUESTS
+                )
+    return _request_slots
+
+
+_rate_limiters = {}
+_rate_limiters_lock = threading.Lock()
+
+
+class RequestRateLimiter:
+    """Leaky bucket spacing requests evenly under a requests-per-minute limit.
+
+    Parameters
+    ----------
+    requests_per_minute : int
+        Maximum number of requests released per minute
+    """
+
+    def __init__(self, requests_per_minute):
+        """Initialize the limiter with an empty bucket."""
+        self.interval = 60.0 / requests_per_minute
+        self._next_release = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until the next request may be sent.
+
+        Returns
+        -------
+        float
+            Seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            release = max(now, self._next_release)
+            self._next_release = release + self.interval
+
+        delay = release - now
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+def get_rate_limiter(provider_name):
+    """Return the process-wide rate limiter for a provider.
+
+    Parameters
+    ----------
+    provider_name : str
+        Name of the provider requests are sent to
+
+    Returns
+    -------
+    RequestRateLimiter or None
+        Limiter sized by the LLM_MAX_REQUESTS_PER_MINUTE setting, None when
+        the setting is 0 and requests are not throttled
+    """
+    requests_per_minute = settings.LLM_MAX_REQUESTS_PER_MINUTE
+    if not requests_per_minute:
+        return None
+
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(provider_name)
+        if limiter is None:
+            limiter = RequestRateLimiter(requests_per_minute)
+            _rate_limiters[provider_name] = limiter
+        return limiter
+
 
 class LLMOrchestrator:
     """Orchestrator service for managing multiple LLM providers with fallback logic.
@@ -201,15 +298,21 @@ class LLMOrchestrator:
             Success result or None if all attempts failed
         """
         provider = self.providers[provider_name]
+        rate_limiter = get_rate_limiter(provider_name)
 
         for attempt in range(max_retries + 1):
             attempt_key = f"{provider_name}_attempt_{attempt + 1}"
             attempts.append(attempt_key)
 
             try:
-                response = provider.generate_response(
-                    prompt=prompt, system_prompt=system_prompt, **kwargs
-                )
+                if rate_limiter is not None:
+                    rate_limiter.acquire()
+
+                # Crawler threads and batch parsing share the provider quota
+                with get_request_slots():
+                    response = provider.generate_response(
+                        prompt=prompt, system_prompt=system_prompt, **kwargs
+                    )
 
                 if provider.validate_response(response):
                     logger.info(
@@ -224,11 +327,6 @@ class LLMOrchestrator:
                 else:
                     raise LLMError(f"Invalid response from {provider_name}")
 
-            except LLMRateLimitError as e:
-                logger.warning(f"Rate limit exceeded for {provider_name}: {e}")
-                errors[attempt_key] = str(e)
-                break  # Don't retry rate limit errors
-
             except LLMError as e:
                 errors[attempt_key] = str(e)
                 if not self._should_retry_provider_error(
@@ -264,13 +362,37 @@ class LLMOrchestrator:
         """
         logger.warning(f"{provider_name} attempt {attempt + 1} failed: {error}")
 
+        if isinstance(error, NON_RETRYABLE_ERRORS):
+            return False
+
         if attempt < max_retries:
-            logger.info(f"Retrying {provider_name} (attempt {attempt + 2})")
+            delay = self._get_retry_delay(attempt)
+            logger.info(
+                f"Retrying {provider_name} in {delay:.2f}s (attempt {attempt + 2})"
+            )
+            time.sleep(delay)
             return True
         else:
             logger.warning(f"All retries exhausted for {provider_name}")
             return False
 
+    def _get_retry_delay(self, attempt):
+        """Get a jittered exponential backoff delay before retrying a provider.
+
+        Parameters
+        ----------
+        attempt : int
+            Zero-based number of the attempt that just failed
+
+        Returns
+        -------
+        float
+            Seconds to wait, drawn uniformly up to the capped exponential bound
+            so concurrent workers hitting the same rate limit spread out
+        """
+        bound = min(RETRY_BACKOFF_INITIAL * 2**attempt, RETRY_BACKOFF_MAX)
+        return random.uniform(0, bound)
+
     def _handle_all_providers_failed(self, attempts, errors):
         """Handle the case when all providers fail.
 
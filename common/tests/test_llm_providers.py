@@ -0,0 +1,90 @@
+from unittest.mock import Mock, patch
+
+from common.llm.providers import GeminiProvider, OpenRouterProvider
+from common.llm.providers.gemini import get_gemini_model
+from common.llm.providers.openrouter import get_openrouter_client
+
+
+class TestGeminiProvider:
+    """Test Gemini provider request building."""
+
+    def setup_method(self):
+        """Set up a provider backed by a mocked model."""
+        self.provider = GeminiProvider()
+        self.provider.model = Mock()
+        self.provider._is_configured = True
+
+    def test_generation_config_json_mode(self):
+        """Test JSON mode requests the application/json response type."""
+        config = self.provider._build_generation_config(0.1, 4000, json_mode=True)
+
+        assert config == {
+            "temperature": 0.1,
+            "max_output_tokens": 4000,
+            "response_mime_type": "application/json",
+        }
+
+    def test_generation_config_response_schema(self):
+        """Test a response schema is set together with the JSON response type."""
+        schema = {"type": "array", "items": {"type": "string"}}
+
+        config = self.provider._build_generation_config(
+            None, None, response_schema=schema
+        )
+
+        assert config == {
+            "response_mime_type": "application/json",
+            "response_schema": schema,
+        }
+
+    def test_generate_response_forwards_json_mode(self):
+        """Test generate_response passes the JSON response type to the model."""
+        self.provider.model.generate_content.return_value = Mock(text=' [{"a": 1}] ')
+
+        response = self.provider.generate_response("prompt", json_mode=True)
+
+        assert response == '[{"a": 1}]'
+        config = self.provider.model.generate_content.call_args.kwargs[
+            "generation_config"
+        ]
+        assert config["response_mime_type"] == "application/json"
+
+    def test_providers_share_one_model_client(self, settings):
+        """Test every provider instance reuses the process-wide model client."""
+        settings.GEMINI_API_KEY = "test-key"
+
+        with (
+            patch("common.llm.providers.gemini._gemini_models", {}),
+            patch("common.llm.providers.gemini.genai") as mock_genai,
+        ):
+            first = GeminiProvider()
+            second = GeminiProvider()
+
+            assert first.model is second.model
+            assert get_gemini_model("test-key", "gemini-1.5-flash") is first.model
+            mock_genai.configure.assert_called_once_with(api_key="test-key")
+            mock_genai.GenerativeModel.assert_called_once_with("gemini-1.5-flash")
+
+
+class TestOpenRouterProvider:
+    """Test OpenRouter provider client setup."""
+
+    def test_providers_share_one_client(self, settings):
+        """Test every provider instance reuses the process-wide OpenAI client."""
+        settings.OPENROUTER_API_KEY = "test-key"
+
+        with (
+            patch("common.llm.providers.openrouter._openrouter_clients", {}),
+            patch("common.llm.providers.openrouter.OpenAI") as mock_openai,
+        ):
+            first = OpenRouterProvider()
+            second = OpenRouterProvider()
+
+            assert first.client is second.client
+            assert (
+                get_openrouter_client("test-key", "https://openrouter.ai/api/v1")
+                is first.client
+            )
+            mock_openai.assert_called_once_with(
+                base_url="https://openrouter.ai/api/v1", api_key="test-key"
+            )
@@ -0,0 +1,124 @@
+import threading
+from unittest.mock import Mock, patch
+
+from common.llm.exceptions import LLMAuthenticationError, LLMRateLimitError
+from common.llm.services import (
+    RETRY_BACKOFF_MAX,
+    LLMOrchestrator,
+    RequestRateLimiter,
+    get_rate_limiter,
+)
+
+
+class TestLLMOrchestrator:
+    """Test orchestrator request dispatch."""
+
+    def setup_method(self):
+        """Set up an orchestrator backed by a mocked provider."""
+        self.provider = Mock()
+        self.provider.is_available.return_value = True
+        self.provider.validate_response.return_value = True
+        self.orchestrator = LLMOrchestrator(providers=[])
+        self.orchestrator.providers = {"mock": self.provider}
+
+    def test_generate_response_holds_request_slot(self):
+        """Test provider calls run while holding a shared request slot."""
+        slots = threading.BoundedSemaphore(1)
+
+        def generate(**kwargs):
+            assert not slots.acquire(blocking=False)
+            return "ok"
+
+        self.provider.generate_response.side_effect = generate
+
+        with patch("common.llm.services.get_request_slots", return_value=slots):
+            result = self.orchestrator.generate_response("prompt")
+
+        assert result["response"] == "ok"
+        assert slots.acquire(blocking=False)
+
+    def test_rate_limited_provider_retries_after_backoff(self):
+        """Test rate limit errors are retried after a backoff delay."""
+        self.provider.generate_response.side_effect = [
+            LLMRateLimitError("429"),
+            "ok",
+        ]
+
+        with (
+            patch("common.llm.services.time.sleep") as mock_sleep,
+            patch("common.llm.services.random.uniform", return_value=0.3),
+        ):
+            result = self.orchestrator.generate_response("prompt", max_retries=1)
+
+        assert result["response"] == "ok"
+        assert result["attempts"] == ["mock_attempt_1", "mock_attempt_2"]
+        mock_sleep.assert_called_once_with(0.3)
+
+    def test_authentication_error_is_not_retried(self):
+        """Test errors a retry cannot fix move straight to the next provider."""
+        fallback = Mock()
+        fallback.is_available.return_value = True
+        fallback.validate_response.return_value = True
+        fallback.generate_response.return_value = "fallback"
+        self.orchestrator.providers["fallback"] = fallback
+        self.provider.generate_response.side_effect = LLMAuthenticationError("401")
+
+        with patch("common.llm.services.time.sleep") as mock_sleep:
+            result = self.orchestrator.generate_response("prompt", max_retries=2)
+
+        assert result["provider"] == "fallback"
+        assert self.provider.generate_response.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_retry_delay_is_capped(self):
+        """Test the backoff bound doubles per attempt up to the cap."""
+        with patch("common.llm.services.random.uniform") as mock_uniform:
+            self.orchestrator._get_retry_delay(1)
+            self.orchestrator._get_retry_delay(10)
+
+        assert mock_uniform.call_args_list[0].args == (0, 1.0)
+        assert mock_uniform.call_args_list[1].args == (0, RETRY_BACKOFF_MAX)
+
+    def test_generate_response_waits_for_rate_limiter(self):
+        """Test each provider attempt first takes a turn from its rate limiter."""
+        limiter = Mock()
+        self.provider.generate_response.return_value = "ok"
+
+        with patch("common.llm.services.get_rate_limiter", return_value=limiter):
+            self.orchestrator.generate_response("prompt")
+
+        limiter.acquire.assert_called_once_with()
+
+
+class TestRequestRateLimiter:
+    """Test per-minute request throttling."""
+
+    def test_acquire_spaces_requests_evenly(self):
+        """Test requests beyond the rate wait for their slot."""
+        limiter = RequestRateLimiter(requests_per_minute=30)
+
+        with (
+            patch("common.llm.services.time.monotonic", return_value=100.0),
+            patch("common.llm.services.time.sleep") as mock_sleep,
+        ):
+            delays = [limiter.acquire() for _ in range(3)]
+
+        assert delays == [0.0, 2.0, 4.0]
+        assert [call.args for call in mock_sleep.call_args_list] == [(2.0,), (4.0,)]
+
+    def test_rate_limiter_disabled_by_default(self, settings):
+        """Test no limiter is used when the per-minute limit is 0."""
+        settings.LLM_MAX_REQUESTS_PER_MINUTE = 0
+
+        assert get_rate_limiter("gemini") is None
+
+    def test_rate_limiter_shared_per_provider(self, settings):
+        """Test every orchestrator shares one limiter per provider."""
+        settings.LLM_MAX_REQUESTS_PER_MINUTE = 20
+
+        with patch("common.llm.services._rate_limiters", {}):
+            limiter = get_rate_limiter("gemini")
+
+            assert get_rate_limiter("gemini") is limiter
+            assert get_rate_limiter("openrouter") is not limiter
+            assert limiter.interval == 3.0
@@ -1,6 +1,8 @@
 import pytest
 from rest_framework.test import APIClient
 
+from django.core.cache import cache
+
 
 @pytest.fixture(scope="session", autouse=True)
 def django_db_setup(django_db_setup, django_db_blocker):
@@ -23,6 +25,12 @@ def auto_setup_method(request):
             setup_method()
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty default cache."""
+    cache.clear()
+
+
 @pytest.fixture()
 def api_client():
     """Django REST Framework API test client."""
@@ -166,6 +166,31 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY", "")
 
+# Number of data sources crawled concurrently by crawl_all_active_sources
+CRAWLER_MAX_WORKERS = int(os.getenv("CRAWLER_MAX_WORKERS", "8"))
+
+# Cache (Redis when CACHE_URL is set, per-process memory otherwise)
+if os.getenv("CACHE_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.getenv("CACHE_URL"),
+        }
+    }
+
+# Seconds a validated LLM parse is reused for identical bank content
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", str(7 * 24 * 60 * 60)))
+
+# Approximate token budget for document content embedded in one LLM prompt
+LLM_MAX_CONTENT_TOKENS = int(os.getenv("LLM_MAX_CONTENT_TOKENS", "100000"))
+# Larger content is parsed in up to this many chunks of LLM_MAX_CONTENT_TOKENS
+LLM_MAX_CONTENT_CHUNKS = int(os.getenv("LLM_MAX_CONTENT_CHUNKS", "4"))
+
+# LLM requests allowed in flight at once per process, across all threads
+LLM_MAX_CONCURRENT_REQUESTS = int(os.getenv("LLM_MAX_CONCURRENT_REQUESTS", "8"))
+# Requests per minute sent to each LLM provider per process, 0 for no limit
+LLM_MAX_REQUESTS_PER_MINUTE = int(os.getenv("LLM_MAX_REQUESTS_PER_MINUTE", "0"))
+
 # Celery Configuration (Redis broker)
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0")
 CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", "redis://localhost:6379/0")